@@ -0,0 +1,77 @@
+"""
+Disposition force-dirigée (Fruchterman-Reingold) compilée avec Numba
+Opère sur la structure CSR du graphe, pour les graphes de grande taille
+"""
+
+import numpy as np
+from numba import njit, prange
+
+@njit(parallel=True, cache=True)
+def spring_layout(indptr, indices, n, iterations=50, k=3.0, seed=42):
+    """
+    Calcule une disposition force-dirigée équivalente à nx.spring_layout :
+    répulsion k²/d entre toutes les paires, attraction d²/k le long des arêtes,
+    déplacement borné par une température décroissante
+    
+    Args:
+        indptr: Pointeurs de lignes de la matrice d'adjacence CSR
+        indices: Indices de colonnes de la matrice d'adjacence CSR
+        n: Nombre de nœuds
+        iterations: Nombre d'itérations
+        k: Distance optimale entre nœuds
+        seed: Graine des positions initiales
+    
+    Returns:
+        np.ndarray: Positions (n, 2) centrées et mises à l'échelle dans [-1, 1]
+    """
+    np.random.seed(seed)
+    pos = np.random.random((n, 2))
+    
+    t = max(pos[:, 0].max() - pos[:, 0].min(), pos[:, 1].max() - pos[:, 1].min()) * 0.1
+    dt = t / (iterations + 1)
+    displacement = np.zeros((n, 2))
+    
+    for _ in range(iterations):
+        for i in prange(n):
+            dx_total = 0.0
+            dy_total = 0.0
+            
+            # Répulsion entre toutes les paires
+            for j in range(n):
+                if i != j:
+                    dx = pos[i, 0] - pos[j, 0]
+                    dy = pos[i, 1] - pos[j, 1]
+                    distance = max(np.sqrt(dx * dx + dy * dy), 0.01)
+                    force = k * k / (distance * distance)
+                    dx_total += dx * force
+                    dy_total += dy * force
+            
+            # Attraction le long des arêtes
+            for e in range(indptr[i], indptr[i + 1]):
+                j = indices[e]
+                dx = pos[i, 0] - pos[j, 0]
+                dy = pos[i, 1] - pos[j, 1]
+                distance = max(np.sqrt(dx * dx + dy * dy), 0.01)
+                force = distance / k
+                dx_total -= dx * force
+                dy_total -= dy * force
+            
+            displacement[i, 0] = dx_total
+            displacement[i, 1] = dy_total
+        
+        # Déplacement limité par la température
+        for i in prange(n):
+            length = max(np.sqrt(displacement[i, 0] ** 2 + displacement[i, 1] ** 2), 0.01)
+            pos[i, 0] += displacement[i, 0] * t / length
+            pos[i, 1] += displacement[i, 1] * t / length
+        t -= dt
+    
+    # Recentrage et mise à l'échelle, comme nx.rescale_layout
+    x_mean = pos[:, 0].mean()
+    y_mean = pos[:, 1].mean()
+    pos[:, 0] -= x_mean
+    pos[:, 1] -= y_mean
+    lim = np.abs(pos).max()
+    if lim > 0:
+        pos /= lim
+    return pos
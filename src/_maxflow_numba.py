@@ -0,0 +1,106 @@
+"""
+Noyau de flot maximal (Edmonds-Karp) compilé avec Numba
+Opère uniquement sur des tableaux NumPy plats au format CSR
+"""
+
+import numpy as np
+import scipy.sparse as sp
+from numba import njit
+from typing import Tuple
+
+def residual_arrays(csr: sp.csr_array) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Construit le réseau résiduel d'une matrice de capacités : chaque arc
+    (u, v) reçoit un arc inverse (v, u), de capacité nulle s'il n'existait pas
+    
+    Args:
+        csr: Matrice des capacités (n x n)
+    
+    Returns:
+        Tuple: (indptr, indices, rev, cap) où rev[e] est l'indice de l'arc inverse de e
+    """
+    n = csr.shape[0]
+    arcs = csr.tocoo()
+    
+    rows = np.concatenate([arcs.row, arcs.col])
+    cols = np.concatenate([arcs.col, arcs.row])
+    data = np.concatenate([arcs.data, np.zeros(arcs.nnz, dtype=arcs.data.dtype)])
+    
+    residual = sp.csr_array((data, (rows, cols)), shape=(n, n))
+    residual.sum_duplicates()
+    residual.sort_indices()
+    
+    indptr = residual.indptr.astype(np.int64)
+    indices = residual.indices.astype(np.int64)
+    cap = residual.data.astype(np.int64)
+    
+    # Indices triés globalement par (ligne, colonne) : l'arc inverse se trouve par dichotomie
+    row_of = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+    keys = row_of * n + indices
+    rev = np.searchsorted(keys, indices * n + row_of).astype(np.int64)
+    
+    return indptr, indices, rev, cap
+
+@njit(cache=True)
+def bfs_augment(indptr, indices, rev, cap, flow, s, t, parent, parent_edge):
+    """
+    Cherche un plus court chemin augmentant de s à t dans le réseau résiduel
+    
+    Returns:
+        bool: True si t est atteint ; parent[v] != -1 marque les nœuds atteints
+    """
+    n = indptr.size - 1
+    parent[:] = -1
+    parent[s] = s
+    
+    queue = np.empty(n, dtype=np.int64)
+    queue[0] = s
+    head, tail = 0, 1
+    while head < tail:
+        u = queue[head]
+        head += 1
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            if parent[v] == -1 and cap[e] - flow[e] > 0:
+                parent[v] = u
+                parent_edge[v] = e
+                if v == t:
+                    return True
+                queue[tail] = v
+                tail += 1
+    
+    return False
+
+@njit(cache=True)
+def edmonds_karp(indptr, indices, rev, cap, s, t):
+    """
+    Calcule un flot maximal s-t par chemins augmentants les plus courts
+    
+    Returns:
+        Tuple: (valeur du flot, masque du côté source de la coupe minimale)
+    """
+    n = indptr.size - 1
+    flow = np.zeros(cap.size, dtype=np.int64)
+    parent = np.empty(n, dtype=np.int64)
+    parent_edge = np.empty(n, dtype=np.int64)
+    
+    value = 0
+    while bfs_augment(indptr, indices, rev, cap, flow, s, t, parent, parent_edge):
+        # Capacité résiduelle minimale le long du chemin
+        bottleneck = cap[parent_edge[t]] - flow[parent_edge[t]]
+        v = t
+        while v != s:
+            e = parent_edge[v]
+            bottleneck = min(bottleneck, cap[e] - flow[e])
+            v = parent[v]
+        
+        v = t
+        while v != s:
+            e = parent_edge[v]
+            flow[e] += bottleneck
+            flow[rev[e]] -= bottleneck
+            v = parent[v]
+        value += bottleneck
+    
+    # Le dernier parcours, sans succès, délimite le côté source
+    return value, parent != -1
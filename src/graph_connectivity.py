@@ -5,9 +5,293 @@ Supporte tous types de graphes (orientés/non-orientés, avec boucles)
 
 import networkx as nx
 import numpy as np
-from typing import Dict, List, Tuple, Set, Optional
-from itertools import combinations
+import scipy.sparse as sp
+from scipy.sparse.csgraph import maximum_flow, breadth_first_order, connected_components
+from networkx.algorithms.connectivity import (build_auxiliary_node_connectivity,
+                                              local_edge_connectivity,
+                                              minimum_st_edge_cut)
+from networkx.algorithms.flow import build_residual_network
+from typing import Dict, List, Tuple, Set, Optional, Union
 import copy
+import hashlib
+import threading
+import warnings
+from collections import Counter, OrderedDict
+from collections.abc import Mapping
+from itertools import chain, combinations, product
+from dataclasses import dataclass, field
+from functools import cached_property
+
+try:
+    # Sérialisation JSON en C, utilisée pour l'export lorsqu'elle est disponible
+    import orjson
+except ImportError:
+    orjson = None
+
+# Noyau de flot compilé (module _maxflow_numba), importé à la première analyse
+# d'un grand graphe : None tant qu'il n'a pas été demandé, False si Numba est absent
+_maxflow_kernel = None
+
+def _load_maxflow_kernel():
+    """
+    Importe le noyau de flot Numba à la première demande
+    
+    Returns:
+        module: Le module _maxflow_numba, ou None si Numba n'est pas installé
+    """
+    global _maxflow_kernel
+    if _maxflow_kernel is None:
+        try:
+            import _maxflow_numba
+            _maxflow_kernel = _maxflow_numba
+        except ImportError:
+            _maxflow_kernel = False
+    return _maxflow_kernel or None
+
+# Résultats partagés entre analyseurs, indexés par (structure du graphe, max_k) ;
+# copies détachées (sans graphe ni analyseur), les moins récemment utilisées évincées
+_GLOBAL_RESULTS: 'OrderedDict[Tuple, ConnectivityResults]' = OrderedDict()
+_GLOBAL_RESULTS_MAX = 32
+# Plusieurs analyses peuvent s'exécuter en parallèle (fils de l'interface)
+_GLOBAL_RESULTS_LOCK = threading.Lock()
+
+def clear_global_cache():
+    """
+    Vide le cache des résultats partagé entre les instances d'analyseur
+    """
+    with _GLOBAL_RESULTS_LOCK:
+        _GLOBAL_RESULTS.clear()
+
+def _structure_key(graph: nx.Graph) -> Tuple:
+    """
+    Empreinte compacte d'un graphe étiqueté : (orienté, multigraphe, n, m,
+    condensé blake2b de la liste des nœuds et des arêtes en indices, triées).
+    Deux graphes ayant les mêmes nœuds, dans le même ordre, et les mêmes
+    arêtes (multiplicités et boucles comprises) ont la même clé
+    
+    Args:
+        graph: Graphe à identifier
+    
+    Returns:
+        Tuple: Clé hachable de taille constante
+    """
+    nodes = list(graph.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    m = graph.number_of_edges()
+    edges = np.fromiter((index[x] for edge in graph.edges() for x in edge),
+                        dtype=np.int64, count=2 * m).reshape(m, 2)
+    if not graph.is_directed():
+        edges.sort(axis=1)
+    # Ordre canonique des arêtes, indépendant de leur ordre d'insertion
+    edges = edges[np.lexsort((edges[:, 1], edges[:, 0]))]
+    
+    digest = hashlib.blake2b(repr(nodes).encode(), digest_size=16)
+    digest.update(edges.tobytes())
+    return (graph.is_directed(), graph.is_multigraph(), len(nodes), m, digest.digest())
+
+def _json_default(obj):
+    """
+    Convertit pour l'export JSON les objets exposant to_dict()
+    """
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    raise TypeError(f"Type non sérialisable: {type(obj).__name__}")
+
+class KAnalysisView(Mapping):
+    """
+    Vue paresseuse sur l'analyse k-connexité : les tests k ≤ κ(G) et k ≤ λ(G)
+    sont calculés d'un bloc, les descriptions seulement à la demande. Se
+    comporte comme le dictionnaire {k: analyse} (get(), values(), in, ...)
+    """
+    
+    def __init__(self, k_arr: np.ndarray, node_ok: np.ndarray, edge_ok: np.ndarray,
+                 node_conn: int, edge_conn: int):
+        """
+        Initialise la vue
+        
+        Args:
+            k_arr: Valeurs de k analysées (1, 2, ...)
+            node_ok: Masque k ≤ κ(G)
+            edge_ok: Masque k ≤ λ(G)
+            node_conn: Connexité par nœuds
+            edge_conn: Connexité par arêtes
+        """
+        self.k_arr = k_arr
+        self.node_ok = node_ok
+        self.edge_ok = edge_ok
+        self.node_conn = node_conn
+        self.edge_conn = edge_conn
+    
+    def __len__(self) -> int:
+        return len(self.k_arr)
+    
+    def __iter__(self):
+        return iter(self.k_arr.tolist())
+    
+    def __contains__(self, k) -> bool:
+        # Clés entières uniquement : '1' in view vaut False
+        return isinstance(k, (int, np.integer)) and 1 <= k <= len(self.k_arr)
+    
+    def __getitem__(self, k: int) -> Dict:
+        if k not in self:
+            raise KeyError(k)
+        
+        i = k - 1
+        return {
+            'k_node_connected': bool(self.node_ok[i]),
+            'k_edge_connected': bool(self.edge_ok[i]),
+            'description': self.descriptions(i, i + 1)[0]
+        }
+    
+    def descriptions(self, start: int = 0, stop: int = None) -> List[str]:
+        """
+        Génère les descriptions textuelles d'une tranche de valeurs de k
+        
+        Args:
+            start: Indice de début dans k_arr
+            stop: Indice de fin (exclu) dans k_arr
+        
+        Returns:
+            List[str]: Une description par valeur de k
+        """
+        window = slice(start, stop)
+        node_words = np.where(self.node_ok[window], "est", "N'EST PAS")
+        edge_words = np.where(self.edge_ok[window], "est", "N'EST PAS")
+        
+        return [f"Le graphe {node_word} {k}-connexe par nœuds | "
+                f"Le graphe {edge_word} {k}-connexe par arêtes"
+                for k, node_word, edge_word in zip(self.k_arr[window].tolist(),
+                                                   node_words, edge_words)]
+    
+    def to_dict(self) -> Dict:
+        """
+        Matérialise la vue sous forme de dictionnaire {k: analyse}
+        
+        Returns:
+            Dict: Analyse complète pour chaque valeur de k
+        """
+        return {k: {'k_node_connected': bool(node_ok),
+                    'k_edge_connected': bool(edge_ok),
+                    'description': description}
+                for k, node_ok, edge_ok, description in zip(self.k_arr.tolist(), self.node_ok,
+                                                            self.edge_ok, self.descriptions())}
+
+@dataclass
+class ConnectivityResults(Mapping):
+    """
+    Résultats de l'analyse de k-connexité
+    
+    κ(G) et λ(G) sont calculés immédiatement ; les coupes minimales et l'analyse
+    par valeur de k ne sont matérialisées qu'au premier accès. L'accès de type
+    dictionnaire (results['cuts']['minimum_node_cut'], 'cuts' in results,
+    results.get(...), ...) reste disponible
+    """
+    basic_info: Dict
+    _node_conn: int
+    _edge_conn: int
+    _max_k: int
+    _graph: Optional[nx.Graph] = field(repr=False)
+    _analyzer: Optional['GraphConnectivityAnalyzer'] = field(repr=False)
+    
+    _KEYS = ('basic_info', 'connectivity', 'cuts', 'k_analysis')
+    
+    def _source(self) -> 'GraphConnectivityAnalyzer':
+        """
+        Analyseur à interroger : celui d'origine tant qu'il porte toujours le
+        même graphe (et donc son cache), un nouvel analyseur sinon
+        """
+        if self._analyzer is None or self._analyzer.graph is not self._graph:
+            self._analyzer = GraphConnectivityAnalyzer(self._graph)
+        return self._analyzer
+    
+    @property
+    def node_connectivity(self) -> int:
+        return self._node_conn
+    
+    @property
+    def edge_connectivity(self) -> int:
+        return self._edge_conn
+    
+    @cached_property
+    def minimum_node_cut(self) -> List:
+        return list(self._source().minimum_node_cut())
+    
+    @cached_property
+    def minimum_edge_cut(self) -> List:
+        return list(self._source().minimum_edge_cut())
+    
+    @cached_property
+    def k_analysis(self) -> KAnalysisView:
+        k_arr = np.arange(1, min(self._max_k + 1, self.basic_info['nodes']))
+        return KAnalysisView(k_arr, k_arr <= self._node_conn, k_arr <= self._edge_conn,
+                             self._node_conn, self._edge_conn)
+    
+    @property
+    def connectivity(self) -> Dict:
+        return {'node_connectivity': self._node_conn,
+                'edge_connectivity': self._edge_conn}
+    
+    @property
+    def cuts(self) -> Dict:
+        return {'minimum_node_cut': self.minimum_node_cut,
+                'minimum_edge_cut': self.minimum_edge_cut}
+    
+    def __getitem__(self, key: str):
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key) -> bool:
+        # Sans passer par __getitem__, qui matérialiserait les coupes
+        return key in self._KEYS
+    
+    def __iter__(self):
+        return iter(self._KEYS)
+    
+    def __len__(self) -> int:
+        return len(self._KEYS)
+    
+    def _copy_for(self, analyzer: Optional['GraphConnectivityAnalyzer']) -> 'ConnectivityResults':
+        """
+        Copie indépendante rattachée à un autre analyseur du même graphe ; les
+        champs déjà matérialisés sont recopiés, les autres restent paresseux
+        
+        Args:
+            analyzer: Analyseur destinataire, ou None pour une copie détachée
+        
+        Returns:
+            ConnectivityResults: Copie profonde des résultats
+        """
+        graph = analyzer.graph if analyzer is not None else None
+        clone = ConnectivityResults(copy.deepcopy(self.basic_info), self._node_conn,
+                                    self._edge_conn, self._max_k, graph, analyzer)
+        for name in ('minimum_node_cut', 'minimum_edge_cut', 'k_analysis'):
+            if name in self.__dict__:
+                clone.__dict__[name] = copy.deepcopy(self.__dict__[name])
+        return clone
+    
+    def _detached(self) -> 'ConnectivityResults':
+        """
+        Copie autonome pour un cache de résultats, sans référence au graphe ni
+        à l'analyseur (et à leurs caches) ; les champs non matérialisés le
+        restent, et sont calculés par la copie rattachée lors d'une réutilisation
+        
+        Returns:
+            ConnectivityResults: Copie détachée des résultats
+        """
+        return self._copy_for(None)
+    
+    def to_dict(self) -> Dict:
+        """
+        Matérialise l'ensemble des résultats sous forme de dictionnaire
+        
+        Returns:
+            Dict: Résultats complets (coupes et analyse k incluses)
+        """
+        return {'basic_info': self.basic_info,
+                'connectivity': self.connectivity,
+                'cuts': self.cuts,
+                'k_analysis': self.k_analysis.to_dict()}
 
 class GraphConnectivityAnalyzer:
     """
@@ -21,9 +305,398 @@ class GraphConnectivityAnalyzer:
         Args:
             graph: Graphe NetworkX (optionnel)
         """
+        self.analysis_cache = {}
+        # À partir de ce nombre de nœuds, le noyau de flot Numba est utilisé
+        # (en dessous, l'import et la compilation JIT coûtent plus que les flots SciPy)
+        self.numba_flow_min_nodes = 500
+        # Réseaux auxiliaires et résiduels NetworkX (multigraphes) par type de
+        # connexité ('node' / 'edge'), réutilisés entre les flots
+        self._auxiliary = {}
+        self._residual = {}
         self.graph = graph
         self.connectivity_results = {}
-        self.analysis_cache = {}
+    
+    @property
+    def graph(self) -> nx.Graph:
+        """
+        Graphe actuellement analysé
+        """
+        return self._graph
+    
+    @graph.setter
+    def graph(self, graph: nx.Graph) -> None:
+        # Tout changement de graphe invalide les résultats mis en cache
+        self._graph = graph
+        self.analysis_cache.clear()
+        self._auxiliary = {}
+        self._residual = {}
+    
+    def _is_connected_fast(self) -> bool:
+        """
+        Teste la connexité du graphe (forte pour un graphe orienté)
+        Un graphe à moins de n - 1 arêtes est rejeté sans parcours ; sinon les
+        composantes sont comptées par SciPy sur la matrice CSR partagée. Le
+        résultat est mis en cache pour être partagé entre les analyses
+        
+        Returns:
+            bool: True si le graphe est connexe
+        """
+        if 'is_connected' not in self.analysis_cache:
+            G = self.graph
+            n = G.number_of_nodes()
+            if n == 0 or G.number_of_edges() < n - 1:
+                connected = False
+            else:
+                n_components, _ = connected_components(self._csr, directed=G.is_directed(),
+                                                       connection='strong')
+                connected = n_components == 1
+            self.analysis_cache['is_connected'] = connected
+        
+        return self.analysis_cache['is_connected']
+    
+    def _is_complete(self) -> bool:
+        """
+        Teste si le graphe est complet en comparant son nombre d'arêtes
+        (boucles exclues) au nombre de paires de nœuds
+        
+        Returns:
+            bool: True si le graphe est complet
+        """
+        G = self.graph
+        n = G.number_of_nodes()
+        if n <= 1 or G.is_multigraph():
+            return False
+        
+        n_pairs = n * (n - 1) if G.is_directed() else n * (n - 1) // 2
+        return G.number_of_edges() - nx.number_of_selfloops(G) == n_pairs
+    
+    def _degrees(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calcule les degrés (boucles exclues) directement sur la matrice CSR
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Degrés sortants et entrants, dans l'ordre
+            de self.analysis_cache['nodes'] (identiques si non orienté)
+        """
+        if 'degrees' not in self.analysis_cache:
+            csr = self._csr
+            out_degree = np.diff(csr.indptr)
+            if self.graph.is_directed():
+                in_degree = np.bincount(csr.indices, minlength=csr.shape[0])
+            else:
+                in_degree = out_degree
+            self.analysis_cache['degrees'] = (out_degree, in_degree)
+        
+        return self.analysis_cache['degrees']
+    
+    def _min_degree_node(self):
+        """
+        Renvoie un nœud de degré minimum (degré total si orienté)
+        
+        Returns:
+            Nœud de degré minimum
+        """
+        out_degree, in_degree = self._degrees()
+        total = out_degree + in_degree if self.graph.is_directed() else out_degree
+        return self.analysis_cache['nodes'][int(np.argmin(total))]
+    
+    def _min_degree(self) -> int:
+        """
+        Calcule le degré minimum δ(G), borne supérieure de κ(G) et λ(G)
+        
+        Returns:
+            int: Degré minimum (entrant/sortant pour un graphe orienté)
+        """
+        if 'min_degree' not in self.analysis_cache:
+            if self.graph.is_multigraph():
+                # Les arêtes parallèles comptent dans le degré d'un multigraphe
+                if self.graph.is_directed():
+                    min_degree = min(min(d for _, d in self.graph.in_degree()),
+                                     min(d for _, d in self.graph.out_degree()))
+                else:
+                    min_degree = min(d for _, d in self.graph.degree())
+            else:
+                out_degree, in_degree = self._degrees()
+                min_degree = int(min(out_degree.min(), in_degree.min()))
+            self.analysis_cache['min_degree'] = min_degree
+        
+        return self.analysis_cache['min_degree']
+    
+    @property
+    def _csr(self) -> sp.csr_array:
+        """
+        Matrice d'adjacence CSR du graphe, construite au premier accès et
+        partagée par toutes les analyses (flots, degrés, connexité) ;
+        capacités unitaires et boucles retirées
+        
+        Returns:
+            sp.csr_array: Matrice d'adjacence (ordre de self.analysis_cache['nodes'])
+        """
+        if 'csr' not in self.analysis_cache:
+            nodes = list(self.graph.nodes())
+            csr = nx.to_scipy_sparse_array(self.graph, nodelist=nodes, weight=None,
+                                           dtype=np.int32, format='csr')
+            if nx.number_of_selfloops(self.graph):
+                csr.setdiag(0)
+                csr.eliminate_zeros()
+            
+            self.analysis_cache['nodes'] = nodes
+            self.analysis_cache['index'] = {node: i for i, node in enumerate(nodes)}
+            self.analysis_cache['csr'] = csr
+        
+        return self.analysis_cache['csr']
+    
+    def _graph_key(self) -> Tuple:
+        """
+        Empreinte du graphe courant (voir _structure_key), calculée une seule fois
+        
+        Returns:
+            Tuple: Clé hachable de taille constante
+        """
+        if 'structure_key' not in self.analysis_cache:
+            self.analysis_cache['structure_key'] = _structure_key(self.graph)
+        return self.analysis_cache['structure_key']
+    
+    def _to_split_csr(self) -> sp.csr_array:
+        """
+        Construit le graphe auxiliaire de dédoublement des nœuds : chaque nœud i
+        devient i_in = i et i_out = n + i reliés par un arc de capacité 1, chaque
+        arc (u, v) devient u_out -> v_in de capacité n
+        
+        Returns:
+            sp.csr_array: Graphe auxiliaire (2n x 2n)
+        """
+        if 'split_csr' not in self.analysis_cache:
+            csr = self._csr
+            n = csr.shape[0]
+            arcs = csr.tocoo()
+            
+            nodes = np.arange(n, dtype=np.int32)
+            rows = np.concatenate([nodes, n + arcs.row.astype(np.int32)])
+            cols = np.concatenate([n + nodes, arcs.col.astype(np.int32)])
+            data = np.concatenate([np.ones(n, dtype=np.int32),
+                                   np.full(arcs.nnz, n, dtype=np.int32)])
+            
+            self.analysis_cache['split_csr'] = sp.csr_array((data, (rows, cols)),
+                                                            shape=(2 * n, 2 * n))
+        
+        return self.analysis_cache['split_csr']
+    
+    def _st_max_flow(self, csr: sp.csr_array, s: int, t: int) -> Tuple[int, np.ndarray]:
+        """
+        Calcule un flot maximal s-t par Edmonds-Karp compilé : noyau Numba
+        pour les grands graphes si disponible, sinon scipy.sparse.csgraph.maximum_flow
+        
+        Args:
+            csr: Matrice des capacités
+            s: Indice de la source
+            t: Indice du puits
+        
+        Returns:
+            Tuple[int, np.ndarray]: Valeur du flot et masque du côté source
+            de la coupe minimale (sommets atteignables dans le graphe résiduel)
+        """
+        kernel = None
+        if self.graph.number_of_nodes() >= self.numba_flow_min_nodes:
+            kernel = _load_maxflow_kernel()
+        if kernel is not None:
+            indptr, indices, rev, cap = self._flow_arrays(csr, kernel)
+            value, source_side = kernel.edmonds_karp(indptr, indices, rev, cap, s, t)
+            return int(value), source_side
+        
+        result = maximum_flow(csr, s, t)
+        
+        residual = csr - result.flow
+        residual.data[residual.data < 0] = 0
+        residual.eliminate_zeros()
+        
+        source_side = np.zeros(csr.shape[0], dtype=bool)
+        source_side[breadth_first_order(residual, s, directed=True,
+                                        return_predecessors=False)] = True
+        return int(result.flow_value), source_side
+    
+    def _flow_arrays(self, csr: sp.csr_array, kernel) -> Tuple[np.ndarray, ...]:
+        """
+        Construit (une seule fois par matrice) les tableaux plats du réseau
+        résiduel consommés par le noyau Numba
+        
+        Args:
+            csr: Matrice des capacités, elle-même conservée dans analysis_cache
+            kernel: Module _maxflow_numba
+        
+        Returns:
+            Tuple[np.ndarray, ...]: (indptr, indices, rev, cap)
+        """
+        flow_arrays = self.analysis_cache.setdefault('flow_arrays', {})
+        if id(csr) not in flow_arrays:
+            flow_arrays[id(csr)] = kernel.residual_arrays(csr)
+        
+        return flow_arrays[id(csr)]
+    
+    def _degree_bound_cut(self) -> Set:
+        """
+        Coupe de nœuds triviale associée au degré minimum : le voisinage
+        (successeurs/prédécesseurs si orienté) d'un nœud de degré minimum
+        
+        Returns:
+            Set: Voisinage isolant un nœud de degré minimum
+        """
+        G = self.graph
+        out_degree, in_degree = self._degrees()
+        nodes = self.analysis_cache['nodes']
+        if G.is_directed() and in_degree.min() < out_degree.min():
+            u = nodes[int(np.argmin(in_degree))]
+            return set(G.predecessors(u)) - {u}
+        
+        u = nodes[int(np.argmin(out_degree))]
+        return set(G[u]) - {u}
+    
+    def _node_cut_search(self) -> Tuple[int, Set]:
+        """
+        Calcule κ(G) et une coupe de nœuds minimale par flots dans le graphe
+        dédoublé, en partant de la borne δ(G) et en ne testant que les paires
+        utiles (voir _node_cut_pairs), avec arrêt dès que κ(G) = 1
+        
+        Returns:
+            Tuple[int, Set]: Connexité par nœuds et coupe minimale associée
+        """
+        G = self.graph
+        best_cut = self._degree_bound_cut()
+        connectivity = len(best_cut)
+        if connectivity <= 1:
+            return connectivity, best_cut
+        
+        split_csr = self._to_split_csr()
+        nodes = self.analysis_cache['nodes']
+        index = self.analysis_cache['index']
+        n = len(nodes)
+        
+        for rank, s, t in self._node_cut_pairs():
+            if rank > connectivity:
+                break
+            if t in G[s]:
+                continue
+            
+            # Flot de s_out vers t_in dans le graphe dédoublé
+            value, source_side = self._st_max_flow(split_csr, n + index[s], index[t])
+            if value < connectivity:
+                connectivity = value
+                best_cut = {nodes[i] for i in range(n)
+                            if source_side[i] and not source_side[n + i]}
+                if connectivity <= 1:
+                    break
+        
+        return connectivity, best_cut
+    
+    def _node_cut_pairs(self):
+        """
+        Énumère les paires (s, t) à tester pour trouver κ(G)
+        
+        Non orienté : nœud u de degré minimum avec ses non-voisins, puis paires
+        de voisins de u (Esfahanian-Hakimi). Orienté : paires ordonnées (v_i, v_j)
+        et (v_j, v_i) avec le rang i, l'appelant s'arrêtant dès que i > κ (Even)
+        
+        Yields:
+            Tuple: (rang, source, puits)
+        """
+        G = self.graph
+        if G.is_directed():
+            nodes = list(G)
+            for i, s in enumerate(nodes):
+                for t in nodes[i + 1:]:
+                    yield i, s, t
+                    yield i, t, s
+            return
+        
+        u = self._min_degree_node()
+        neighbors = set(G[u]) - {u}
+        
+        # Paires (u, v) avec v non voisin de u
+        for v in G:
+            if v != u and v not in neighbors:
+                yield 0, u, v
+        # Paires de voisins de u
+        for x, y in combinations(neighbors, 2):
+            yield 0, x, y
+    
+    def _gomory_hu_tree(self) -> nx.Graph:
+        """
+        Construit (une seule fois) l'arbre de Gomory-Hu d'un graphe non orienté
+        par l'algorithme de Gusfield : n - 1 flots maximaux, après quoi toute
+        coupe minimale u-v se lit sur le chemin u-v de l'arbre
+        
+        Returns:
+            nx.Graph: Arbre de coupes, arêtes pondérées par 'weight'
+        """
+        if 'gh_tree' not in self.analysis_cache:
+            csr = self._csr
+            nodes = self.analysis_cache['nodes']
+            n = len(nodes)
+            
+            parent = np.zeros(n, dtype=np.int64)
+            weight = np.zeros(n, dtype=np.int64)
+            for s in range(1, n):
+                t = parent[s]
+                value, source_side = self._st_max_flow(csr, s, t)
+                weight[s] = value
+                
+                # Les nœuds du côté de s rattachés à t sont rattachés à s
+                moved = source_side & (parent == t)
+                moved[s] = False
+                parent[moved] = s
+                if source_side[parent[t]]:
+                    parent[s] = parent[t]
+                    parent[t] = s
+                    weight[s] = weight[t]
+                    weight[t] = value
+            
+            tree = nx.Graph()
+            tree.add_nodes_from(nodes)
+            tree.add_weighted_edges_from((nodes[i], nodes[parent[i]], int(weight[i]))
+                                         for i in range(1, n))
+            self.analysis_cache['gh_tree'] = tree
+        
+        return self.analysis_cache['gh_tree']
+    
+    def _edge_cut_search(self) -> Tuple[int, Set]:
+        """
+        Calcule λ(G) et une coupe d'arêtes minimale
+        
+        Non orienté : arête la plus légère de l'arbre de Gomory-Hu, la coupe
+        étant formée des arêtes de G qui relient ses deux composantes.
+        Orienté : flots entre un nœud fixé et chacun des autres dans les deux
+        sens, avec arrêt dès que λ(G) = 1
+        
+        Returns:
+            Tuple[int, Set]: Connexité par arêtes et coupe minimale associée
+        """
+        if not self.graph.is_directed():
+            tree = self._gomory_hu_tree()
+            u, v, connectivity = min(tree.edges(data='weight'), key=lambda e: e[2])
+            side = nx.node_connected_component(nx.restricted_view(tree, [], [(u, v)]), u)
+            return connectivity, {(a, b) for a, b in self.graph.edges()
+                                  if (a in side) != (b in side)}
+        
+        csr = self._csr
+        nodes = self.analysis_cache['nodes']
+        n = len(nodes)
+        
+        pairs = [(0, j) for j in range(1, n)] + [(j, 0) for j in range(1, n)]
+        
+        connectivity, best_side = None, None
+        for s, t in pairs:
+            value, source_side = self._st_max_flow(csr, s, t)
+            if connectivity is None or value < connectivity:
+                connectivity, best_side = value, source_side
+                if connectivity <= 1:
+                    break
+        
+        if connectivity is None:
+            return 0, set()
+        
+        best_cut = {(nodes[u], nodes[v]) for u, v in zip(*csr.nonzero())
+                    if best_side[u] and not best_side[v]}
+        return connectivity, best_cut
     
     def load_graph_from_file(self, filepath: str, format_type: str = 'edgelist') -> bool:
         """
@@ -38,19 +711,21 @@ class GraphConnectivityAnalyzer:
         """
         try:
             if format_type == 'edgelist':
-                self.graph = nx.read_edgelist(filepath, create_using=nx.Graph())
+                self.graph = self._read_edgelist(filepath)
             elif format_type == 'gml':
                 self.graph = nx.read_gml(filepath)
             elif format_type == 'graphml':
                 self.graph = nx.read_graphml(filepath)
             elif format_type == 'adjlist':
-                self.graph = nx.read_adjlist(filepath)
+                self.graph = nx.read_adjlist(filepath, create_using=nx.Graph())
             else:
                 raise ValueError(f"Format non supporté: {format_type}")
             
-            # Gestion des boucles et arêtes multiples
-            if isinstance(self.graph, nx.MultiGraph):
-                self.graph = nx.Graph(self.graph)  # Conversion en graphe simple
+            # Gestion des boucles et arêtes multiples : seuls les fichiers GML/GraphML
+            # déclarant un multigraphe sont convertis (en conservant l'orientation)
+            if self.graph.is_multigraph():
+                simple_type = nx.DiGraph if self.graph.is_directed() else nx.Graph
+                self.graph = simple_type(self.graph)  # Conversion en graphe simple
             
             print(f"✓ Graphe chargé: {self.graph.number_of_nodes()} nœuds, {self.graph.number_of_edges()} arêtes")
             return True
@@ -59,24 +734,94 @@ class GraphConnectivityAnalyzer:
             print(f"✗ Erreur lors du chargement: {e}")
             return False
     
-    def create_graph_from_edges(self, edges: List[Tuple], directed: bool = False) -> bool:
+    @staticmethod
+    def _read_edgelist(filepath: str) -> nx.Graph:
+        """
+        Lit une liste d'arêtes : les fichiers de paires d'entiers sont analysés
+        d'un bloc par NumPy, les autres (étiquettes non entières, données
+        d'arêtes en colonnes supplémentaires) passent par le lecteur NetworkX
+        
+        Args:
+            filepath: Chemin vers le fichier
+        
+        Returns:
+            nx.Graph: Graphe non orienté
+        """
+        try:
+            with warnings.catch_warnings():
+                # Fichier vide (ou uniquement des commentaires) : traité ci-dessous
+                warnings.simplefilter('ignore', UserWarning)
+                arr = np.loadtxt(filepath, dtype=np.int64, ndmin=2)
+        except ValueError:
+            # Étiquettes non entières, données d'arêtes ou ligne incomplète
+            return GraphConnectivityAnalyzer._read_edgelist_networkx(filepath)
+        
+        if arr.size == 0:
+            return nx.Graph()
+        if arr.shape[1] != 2:
+            # Colonnes supplémentaires (poids...) : interprétées par NetworkX
+            return GraphConnectivityAnalyzer._read_edgelist_networkx(filepath)
+        
+        return GraphConnectivityAnalyzer._graph_from_edge_array(arr)
+    
+    @staticmethod
+    def _read_edgelist_networkx(filepath: str) -> nx.Graph:
+        """
+        Lecteur NetworkX des listes d'arêtes : les étiquettes restent entières
+        lorsqu'elles le sont toutes, comme pour la lecture NumPy
+        
+        Args:
+            filepath: Chemin vers le fichier
+        
+        Returns:
+            nx.Graph: Graphe non orienté
+        """
+        try:
+            return nx.read_edgelist(filepath, create_using=nx.Graph(), nodetype=int)
+        except TypeError:
+            # Au moins une étiquette non entière : étiquettes textuelles
+            return nx.read_edgelist(filepath, create_using=nx.Graph())
+    
+    @staticmethod
+    def _graph_from_edge_array(arr: np.ndarray, directed: bool = False) -> nx.Graph:
+        """
+        Construit un graphe sans attributs d'arêtes à partir d'un tableau (m, 2)
+        d'étiquettes entières
+        
+        Args:
+            arr: Tableau des arêtes
+            directed: True pour un graphe orienté
+        
+        Returns:
+            nx.Graph: Graphe dont les nœuds sont les entiers présents dans arr,
+            dans l'ordre de première apparition (comme nx.read_edgelist)
+        """
+        graph = nx.DiGraph() if directed else nx.Graph()
+        graph.add_edges_from(arr.tolist())
+        return graph
+    
+    def create_graph_from_edges(self, edges: Union[List[Tuple], np.ndarray], directed: bool = False) -> bool:
         """
         Crée un graphe à partir d'une liste d'arêtes
         
         Args:
-            edges: Liste de tuples (u, v) représentant les arêtes
+            edges: Liste de tuples (u, v) ou tableau NumPy (m, 2) d'entiers
             directed: True pour un graphe orienté
         
         Returns:
             bool: True si la création réussit
         """
         try:
-            if directed:
-                self.graph = nx.DiGraph()
+            if isinstance(edges, np.ndarray):
+                # Tableau (m, 2) d'étiquettes entières
+                self.graph = self._graph_from_edge_array(edges.reshape(-1, 2), directed)
             else:
-                self.graph = nx.Graph()
-            
-            self.graph.add_edges_from(edges)
+                if directed:
+                    self.graph = nx.DiGraph()
+                else:
+                    self.graph = nx.Graph()
+                
+                self.graph.add_edges_from(edges)
             
             print(f"✓ Graphe créé: {self.graph.number_of_nodes()} nœuds, {self.graph.number_of_edges()} arêtes")
             return True
@@ -85,6 +830,47 @@ class GraphConnectivityAnalyzer:
             print(f"✗ Erreur lors de la création: {e}")
             return False
     
+    def _compute_connectivity_with_cut(self, kind: str) -> None:
+        """
+        Calcule en une seule série de flots la connexité et une coupe minimale
+        témoin, et les place ensemble dans analysis_cache
+        
+        Args:
+            kind: 'node' pour κ(G) et sa coupe de nœuds, 'edge' pour λ(G) et sa coupe d'arêtes
+        """
+        G = self.graph
+        
+        # Cas spéciaux
+        if G.number_of_nodes() <= 1 or not self._is_connected_fast():
+            connectivity, cut = 0, set()
+        elif kind == 'node':
+            if self._is_complete():
+                # Pour un graphe complet, on peut retirer n'importe quels n-1 nœuds
+                connectivity = G.number_of_nodes() - 1
+                cut = set(list(G.nodes())[:-1])
+            elif G.is_multigraph():
+                # Multigraphe non représentable en CSR : flots NetworkX, κ(G) et
+                # la coupe minimale en une seule série
+                connectivity, cut = self._multigraph_cut('node')
+            else:
+                # Calcul général utilisant l'algorithme de flux maximal
+                connectivity, cut = self._node_cut_search()
+        else:
+            if G.is_multigraph():
+                # Multigraphe non représentable en CSR : flots NetworkX, λ(G) et
+                # la coupe minimale en une seule série
+                connectivity, cut = self._multigraph_cut('edge')
+            elif not G.is_directed() and self._min_degree() <= 1:
+                # Connexe avec δ(G) = 1 : l'arête d'un nœud de degré 1 est un pont
+                u = self._min_degree_node()
+                connectivity, cut = 1, {(u, v) for v in G[u] if v != u}
+            else:
+                # Calcul utilisant l'algorithme de flux maximal
+                connectivity, cut = self._edge_cut_search()
+        
+        self.analysis_cache[f'{kind}_connectivity'] = connectivity
+        self.analysis_cache[f'minimum_{kind}_cut'] = cut
+    
     def node_connectivity(self) -> int:
         """
         Calcule la connexité par nœuds (κ(G))
@@ -95,23 +881,11 @@ class GraphConnectivityAnalyzer:
         if not self.graph:
             return 0
         
-        if 'node_connectivity' in self.analysis_cache:
-            return self.analysis_cache['node_connectivity']
-        
         try:
-            # Cas spéciaux
-            if self.graph.number_of_nodes() <= 1:
-                connectivity = 0
-            elif not nx.is_connected(self.graph):
-                connectivity = 0
-            elif nx.is_complete_graph(self.graph):
-                connectivity = self.graph.number_of_nodes() - 1
-            else:
-                # Calcul général utilisant l'algorithme de flux maximal
-                connectivity = nx.node_connectivity(self.graph)
+            if 'node_connectivity' not in self.analysis_cache:
+                self._compute_connectivity_with_cut('node')
             
-            self.analysis_cache['node_connectivity'] = connectivity
-            return connectivity
+            return self.analysis_cache['node_connectivity']
             
         except Exception as e:
             print(f"Erreur lors du calcul de la connexité par nœuds: {e}")
@@ -127,21 +901,11 @@ class GraphConnectivityAnalyzer:
         if not self.graph:
             return 0
         
-        if 'edge_connectivity' in self.analysis_cache:
-            return self.analysis_cache['edge_connectivity']
-        
         try:
-            # Cas spéciaux
-            if self.graph.number_of_nodes() <= 1:
-                connectivity = 0
-            elif not nx.is_connected(self.graph):
-                connectivity = 0
-            else:
-                # Calcul utilisant l'algorithme de flux maximal
-                connectivity = nx.edge_connectivity(self.graph)
+            if 'edge_connectivity' not in self.analysis_cache:
+                self._compute_connectivity_with_cut('edge')
             
-            self.analysis_cache['edge_connectivity'] = connectivity
-            return connectivity
+            return self.analysis_cache['edge_connectivity']
             
         except Exception as e:
             print(f"Erreur lors du calcul de la connexité par arêtes: {e}")
@@ -154,16 +918,14 @@ class GraphConnectivityAnalyzer:
         Returns:
             Set: Ensemble des nœuds de la coupe minimale
         """
-        if not self.graph or not nx.is_connected(self.graph):
+        if not self.graph:
             return set()
         
         try:
-            if nx.is_complete_graph(self.graph):
-                # Pour un graphe complet, on peut retirer n'importe quels n-1 nœuds
-                nodes = list(self.graph.nodes())
-                return set(nodes[:-1])
+            if 'minimum_node_cut' not in self.analysis_cache:
+                self._compute_connectivity_with_cut('node')
             
-            return nx.minimum_node_cut(self.graph)
+            return set(self.analysis_cache['minimum_node_cut'])
             
         except Exception as e:
             print(f"Erreur lors du calcul de la coupe minimale: {e}")
@@ -176,17 +938,142 @@ class GraphConnectivityAnalyzer:
         Returns:
             Set: Ensemble des arêtes de la coupe minimale
         """
-        if not self.graph or not nx.is_connected(self.graph):
+        if not self.graph:
             return set()
         
         try:
-            return nx.minimum_edge_cut(self.graph)
+            if 'minimum_edge_cut' not in self.analysis_cache:
+                self._compute_connectivity_with_cut('edge')
+            
+            return set(self.analysis_cache['minimum_edge_cut'])
             
         except Exception as e:
             print(f"Erreur lors du calcul de la coupe d'arêtes minimale: {e}")
             return set()
     
-    def k_connectivity_analysis(self, max_k: int = None) -> Dict:
+    def _flow_networks(self, kind: str) -> Tuple[nx.DiGraph, nx.DiGraph]:
+        """
+        Réseau auxiliaire de connexité et réseau résiduel associé, construits
+        une seule fois par graphe pour les flots NetworkX successifs
+        
+        Args:
+            kind: 'node' pour la connexité par nœuds, 'edge' pour la connexité par arêtes
+        
+        Returns:
+            Tuple: (réseau auxiliaire, réseau résiduel)
+        """
+        if kind not in self._auxiliary:
+            G = self.graph
+            if kind == 'node':
+                auxiliary = build_auxiliary_node_connectivity(G)
+            else:
+                # Capacité = nombre d'arêtes parallèles (boucles ignorées), là où
+                # build_auxiliary_edge_connectivity fusionne les arêtes multiples
+                counts = Counter((u, v) for u, v in G.edges() if u != v)
+                if not G.is_directed():
+                    counts.update({(v, u): c for (u, v), c in counts.items()})
+                auxiliary = nx.DiGraph()
+                auxiliary.add_nodes_from(G)
+                auxiliary.add_edges_from((u, v, {'capacity': c}) for (u, v), c in counts.items())
+            self._auxiliary[kind] = auxiliary
+            self._residual[kind] = build_residual_network(auxiliary, 'capacity')
+        return self._auxiliary[kind], self._residual[kind]
+    
+    def _multigraph_cut(self, kind: str) -> Tuple[int, Set]:
+        """
+        Coupe minimale globale d'un multigraphe connexe (non complet) par flots
+        s-t NetworkX, tous calculés sur les réseaux de _flow_networks
+        
+        Args:
+            kind: 'node' pour une coupe de nœuds, 'edge' pour une coupe d'arêtes
+        
+        Returns:
+            Tuple[int, Set]: Connexité (arêtes parallèles comptées pour λ(G)) et
+            coupe minimale (paires de nœuds pour une coupe d'arêtes)
+        """
+        G = self.graph
+        auxiliary, residual = self._flow_networks(kind)
+        v = min(G, key=G.degree)
+        
+        if kind == 'edge':
+            # Coupe initiale : arêtes sortantes de v ; une coupe minimale sépare
+            # ensuite deux nœuds consécutifs de tout ordre cyclique
+            min_cut = set(auxiliary.edges(v))
+            min_value = sum(auxiliary[a][b]['capacity'] for a, b in min_cut)
+            nodes = list(G)
+            for s, t in zip(nodes, nodes[1:] + nodes[:1]):
+                cut = minimum_st_edge_cut(G, s, t, auxiliary=auxiliary, residual=residual)
+                value = sum(auxiliary[a][b]['capacity'] for a, b in cut)
+                if value <= min_value:
+                    min_value, min_cut = value, cut
+            return min_value, min_cut
+        
+        mapping = auxiliary.graph['mapping']
+        
+        def st_node_cut(s, t):
+            # Comme minimum_st_node_cut, qui renvoie toutefois un ensemble vide
+            # dès qu'un arc t -> s existe
+            edge_cut = minimum_st_edge_cut(auxiliary, f"{mapping[s]}B", f"{mapping[t]}A",
+                                           auxiliary=auxiliary, residual=residual)
+            return {auxiliary.nodes[node]['id'] for edge in edge_cut for node in edge} - {s, t}
+        
+        # Soit une coupe minimale S évite v et le sépare d'un autre nœud (dans un
+        # sens ou dans l'autre si orienté), soit v ∈ S et S sépare un prédécesseur
+        # d'un successeur de v
+        others = [w for w in G if w != v]
+        if G.is_directed():
+            pairs = chain(((v, w) for w in others), ((w, v) for w in others),
+                          product(G.predecessors(v), G.successors(v)))
+        else:
+            pairs = chain(((v, w) for w in others), combinations(G[v], 2))
+        min_cut = set(G[v]) - {v}
+        
+        for s, t in pairs:
+            if s == t or t in G[s]:
+                # Arc s -> t : aucune coupe de nœuds ne les sépare
+                continue
+            cut = st_node_cut(s, t)
+            if len(cut) < len(min_cut):
+                min_cut = cut
+        return len(min_cut), min_cut
+    
+    def all_pairs_mincut(self, u, v) -> int:
+        """
+        Calcule la connexité par arêtes locale λ(u, v), c'est-à-dire la taille
+        d'une coupe d'arêtes minimale séparant u de v
+        
+        Args:
+            u: Nœud source
+            v: Nœud puits
+        
+        Returns:
+            int: Nombre minimal d'arêtes à supprimer pour séparer u de v
+        """
+        if not self.graph or u == v:
+            return 0
+        
+        try:
+            if self.graph.is_multigraph():
+                auxiliary, residual = self._flow_networks('edge')
+                return local_edge_connectivity(self.graph, u, v, auxiliary=auxiliary,
+                                               residual=residual)
+            
+            if self.graph.is_directed():
+                csr = self._csr
+                index = self.analysis_cache['index']
+                value, _ = self._st_max_flow(csr, index[u], index[v])
+                return value
+            
+            # Poids minimal sur l'unique chemin u-v de l'arbre de Gomory-Hu
+            tree = self._gomory_hu_tree()
+            path = nx.shortest_path(tree, u, v)
+            return min(tree[a][b]['weight'] for a, b in zip(path, path[1:]))
+            
+        except Exception as e:
+            print(f"Erreur lors du calcul de la coupe minimale {u}-{v}: {e}")
+            return 0
+    
+    def k_connectivity_analysis(self, max_k: int = None) -> 'ConnectivityResults':
         """
         Analyse complète de la k-connexité
         
@@ -194,7 +1081,7 @@ class GraphConnectivityAnalyzer:
             max_k: Valeur maximale de k à tester (par défaut: nombre de nœuds)
         
         Returns:
-            Dict: Résultats de l'analyse
+            ConnectivityResults: Résultats de l'analyse (accès de type dictionnaire)
         """
         if not self.graph:
             return {}
@@ -203,64 +1090,41 @@ class GraphConnectivityAnalyzer:
         if max_k is None:
             max_k = n_nodes
         
-        results = {
-            'basic_info': {
+        # Analyse déjà effectuée sur un graphe identique par un autre analyseur
+        key = (self._graph_key(), max_k)
+        with _GLOBAL_RESULTS_LOCK:
+            cached = _GLOBAL_RESULTS.get(key)
+            if cached is not None:
+                _GLOBAL_RESULTS.move_to_end(key)
+                cached = cached._copy_for(self)
+        if cached is not None:
+            self.connectivity_results = cached
+            return cached
+        
+        # κ(G) et λ(G) en entiers Python natifs ; coupes et analyse k à la demande
+        results = ConnectivityResults(
+            basic_info={
                 'nodes': n_nodes,
                 'edges': self.graph.number_of_edges(),
-                'is_connected': nx.is_connected(self.graph),
+                'is_connected': self._is_connected_fast(),
                 'is_directed': self.graph.is_directed()
             },
-            'connectivity': {
-                'node_connectivity': self.node_connectivity(),
-                'edge_connectivity': self.edge_connectivity()
-            },
-            'cuts': {
-                'minimum_node_cut': list(self.minimum_node_cut()),
-                'minimum_edge_cut': list(self.minimum_edge_cut())
-            },
-            'k_analysis': {}
-        }
-        
-        # Analyse pour différentes valeurs de k
-        node_conn = results['connectivity']['node_connectivity']
-        edge_conn = results['connectivity']['edge_connectivity']
-        
-        for k in range(1, min(max_k + 1, n_nodes)):
-            results['k_analysis'][k] = {
-                'k_node_connected': k <= node_conn,
-                'k_edge_connected': k <= edge_conn,
-                'description': self._get_k_connectivity_description(k, node_conn, edge_conn)
-            }
+            _node_conn=int(self.node_connectivity()),
+            _edge_conn=int(self.edge_connectivity()),
+            _max_k=max_k,
+            _graph=self.graph,
+            _analyzer=self
+        )
         
+        # L'appelant reçoit ses propres résultats : le cache n'est pas exposé
+        with _GLOBAL_RESULTS_LOCK:
+            _GLOBAL_RESULTS[key] = results._detached()
+            _GLOBAL_RESULTS.move_to_end(key)
+            if len(_GLOBAL_RESULTS) > _GLOBAL_RESULTS_MAX:
+                _GLOBAL_RESULTS.popitem(last=False)
         self.connectivity_results = results
         return results
     
-    def _get_k_connectivity_description(self, k: int, node_conn: int, edge_conn: int) -> str:
-        """
-        Génère une description de la k-connexité
-        
-        Args:
-            k: Valeur de k
-            node_conn: Connexité par nœuds
-            edge_conn: Connexité par arêtes
-        
-        Returns:
-            str: Description textuelle
-        """
-        descriptions = []
-        
-        if k <= node_conn:
-            descriptions.append(f"Le graphe est {k}-connexe par nœuds")
-        else:
-            descriptions.append(f"Le graphe N'EST PAS {k}-connexe par nœuds")
-        
-        if k <= edge_conn:
-            descriptions.append(f"Le graphe est {k}-connexe par arêtes")
-        else:
-            descriptions.append(f"Le graphe N'EST PAS {k}-connexe par arêtes")
-        
-        return " | ".join(descriptions)
-    
     def get_summary(self) -> str:
         """
         Génère un résumé de l'analyse de connexité
@@ -294,8 +1158,9 @@ class GraphConnectivityAnalyzer:
 
 📈 ANALYSE K-CONNEXITÉ:"""
         
-        for k, analysis in results['k_analysis'].items():
-            summary += f"\n   • k={k}: {analysis['description']}"
+        k_analysis = results['k_analysis']
+        summary += "".join(f"\n   • k={k}: {description}"
+                           for k, description in zip(k_analysis, k_analysis.descriptions()))
         
         summary += "\n═══════════════════════════════════════════════════════════════"
         
@@ -314,9 +1179,17 @@ class GraphConnectivityAnalyzer:
         """
         try:
             if format_type == 'json':
-                import json
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(self.connectivity_results, f, indent=2, ensure_ascii=False)
+                if orjson is not None:
+                    options = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                               | orjson.OPT_PASSTHROUGH_DATACLASS)
+                    with open(filepath, 'wb') as f:
+                        f.write(orjson.dumps(self.connectivity_results, default=_json_default,
+                                             option=options))
+                else:
+                    import json
+                    with open(filepath, 'w', encoding='utf-8') as f:
+                        json.dump(self.connectivity_results, f, indent=2, ensure_ascii=False,
+                                  default=_json_default)
             elif format_type == 'txt':
                 with open(filepath, 'w', encoding='utf-8') as f:
                     f.write(self.get_summary())
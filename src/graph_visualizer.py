@@ -5,10 +5,37 @@ Utilise matplotlib et networkx pour créer des visualisations interactives
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+import matplotlib.colors as mcolors
+from matplotlib.collections import LineCollection
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import networkx as nx
 import numpy as np
 from typing import Dict, List, Set, Tuple, Optional
 import colorsys
+import copy
+from collections import OrderedDict
+
+from graph_connectivity import _structure_key
+
+# Disposition compilée (module _layout_numba), chargée au premier grand graphe :
+# None tant qu'elle n'a pas été demandée, False si Numba n'est pas installé
+_layout_kernel = None
+
+def _load_layout_kernel():
+    """
+    Importe le spring layout Numba à la première demande
+    
+    Returns:
+        function: spring_layout de _layout_numba, ou None si Numba n'est pas installé
+    """
+    global _layout_kernel
+    if _layout_kernel is None:
+        try:
+            from _layout_numba import spring_layout
+            _layout_kernel = spring_layout
+        except ImportError:
+            _layout_kernel = False
+    return _layout_kernel or None
 
 class GraphVisualizer:
     """
@@ -23,6 +50,25 @@ class GraphVisualizer:
         self.ax = None
         self.pos = None
         
+        # Positions au format tableau (une ligne par nœud), index associé
+        # et emprise (xmin, xmax, ymin, ymax) du dessin
+        self._node_array = None
+        self._index_of = {}
+        self._xy_bounds = None
+        
+        # Au-delà de ce nombre de nœuds, les étiquettes ne sont pas dessinées
+        self.max_labeled_nodes = 200
+        
+        # À partir de ce nombre de nœuds, le spring layout compilé est utilisé
+        # (en dessous, la compilation JIT coûte plus qu'elle ne rapporte)
+        self.numba_layout_min_nodes = 200
+        
+        # Dispositions déjà calculées, conservées d'une visualisation à l'autre et
+        # indexées par (empreinte du graphe, layout) ; les moins récemment
+        # utilisées sont évincées au-delà de layout_cache_size
+        self._layout_cache: 'OrderedDict[Tuple, Dict]' = OrderedDict()
+        self.layout_cache_size = 8
+        
         # Configuration des couleurs
         self.color_scheme = {
             'node_default': '#4A90E2',
@@ -33,6 +79,10 @@ class GraphVisualizer:
             'edge_highlight': '#F39C12',
             'background': '#FFFFFF'
         }
+        
+        # Couleurs résolues une seule fois en RGBA pour les coloriages vectorisés
+        self._rgba = {name: np.array(mcolors.to_rgba(color))
+                      for name, color in self.color_scheme.items()}
     
     def setup_plot(self, figsize: Tuple[int, int] = (12, 8)) -> None:
         """
@@ -54,31 +104,146 @@ class GraphVisualizer:
         self.ax.set_title('Analyse de K-Connexité', 
                          fontsize=16, fontweight='bold', pad=20)
     
-    def calculate_layout(self, graph: nx.Graph, layout_type: str = 'spring') -> Dict:
+    def calculate_layout(self, graph: nx.Graph, layout_type: str = 'spring',
+                         force: bool = False) -> Dict:
         """
         Calcule la disposition des nœuds
         
         Args:
             graph: Graphe NetworkX
             layout_type: Type de layout ('spring', 'circular', 'random', 'shell')
+            force: True pour recalculer la disposition même si elle est déjà connue
         
         Returns:
             Dict: Positions des nœuds
         """
-        if layout_type == 'spring':
-            self.pos = nx.spring_layout(graph, k=3, iterations=50, seed=42)
-        elif layout_type == 'circular':
-            self.pos = nx.circular_layout(graph)
-        elif layout_type == 'random':
-            self.pos = nx.random_layout(graph, seed=42)
-        elif layout_type == 'shell':
-            self.pos = nx.shell_layout(graph)
+        # Les layouts sont déterministes : un graphe identique réutilise le résultat
+        key = (_structure_key(graph), layout_type)
+        if not force and key in self._layout_cache:
+            self._layout_cache.move_to_end(key)
+            self.pos = self._layout_cache[key]
         else:
-            # Layout par défaut
-            self.pos = nx.spring_layout(graph, k=3, iterations=50, seed=42)
+            if layout_type == 'spring':
+                self.pos = self._spring_layout(graph)
+            elif layout_type == 'circular':
+                self.pos = nx.circular_layout(graph)
+            elif layout_type == 'random':
+                self.pos = nx.random_layout(graph, seed=42)
+            elif layout_type == 'shell':
+                self.pos = nx.shell_layout(graph)
+            else:
+                # Layout par défaut
+                self.pos = self._spring_layout(graph)
+            self._layout_cache[key] = self.pos
+            self._layout_cache.move_to_end(key)
+            if len(self._layout_cache) > self.layout_cache_size:
+                self._layout_cache.popitem(last=False)
+        
+        self._index_of = {node: i for i, node in enumerate(graph.nodes())}
+        self._node_array = np.array([self.pos[node] for node in graph.nodes()],
+                                    dtype=float).reshape(-1, 2)
+        if len(self._node_array):
+            xmin, ymin = self._node_array.min(axis=0)
+            xmax, ymax = self._node_array.max(axis=0)
+            self._xy_bounds = (xmin, xmax, ymin, ymax)
+        else:
+            self._xy_bounds = None
         
         return self.pos
     
+    def _spring_layout(self, graph: nx.Graph) -> Dict:
+        """
+        Calcule un spring layout, compilé avec Numba pour les grands graphes
+        
+        Args:
+            graph: Graphe NetworkX
+        
+        Returns:
+            Dict: Positions des nœuds
+        """
+        n = graph.number_of_nodes()
+        spring_layout_numba = None
+        if n >= self.numba_layout_min_nodes:
+            spring_layout_numba = _load_layout_kernel()
+        if spring_layout_numba is None:
+            return nx.spring_layout(graph, k=3, iterations=50, seed=42)
+        
+        nodes = list(graph.nodes())
+        adjacency = nx.to_scipy_sparse_array(graph, nodelist=nodes, weight=None, format='csr')
+        xy = spring_layout_numba(adjacency.indptr.astype(np.int64),
+                                 adjacency.indices.astype(np.int64), n,
+                                 iterations=50, k=3.0, seed=42)
+        return dict(zip(nodes, xy))
+    
+    def _edge_segments(self, graph: nx.Graph) -> np.ndarray:
+        """
+        Construit les segments des arêtes par indexation du tableau des positions
+        
+        Args:
+            graph: Graphe NetworkX
+        
+        Returns:
+            np.ndarray: Segments de forme (nombre d'arêtes, 2, 2)
+        """
+        index_of = self._index_of
+        edge_index = np.array([(index_of[u], index_of[v]) for u, v in graph.edges()],
+                              dtype=np.intp).reshape(-1, 2)
+        return self._node_array[edge_index]
+    
+    def _draw_edges(self, ax, graph: nx.Graph, edge_color, width: float, alpha: float) -> None:
+        """
+        Dessine toutes les arêtes en une seule LineCollection
+        (flèches NetworkX conservées pour les graphes orientés)
+        
+        Args:
+            ax: Axes matplotlib
+            graph: Graphe NetworkX
+            edge_color: Couleur unique ou une couleur par arête
+            width: Épaisseur des arêtes
+            alpha: Transparence
+        """
+        if graph.is_directed():
+            nx.draw_networkx_edges(graph, self.pos, edge_color=edge_color,
+                                   width=width, alpha=alpha, ax=ax)
+            return
+        
+        edges = LineCollection(self._edge_segments(graph), colors=edge_color,
+                               linewidths=width, alpha=alpha, zorder=1)
+        ax.add_collection(edges)
+        ax.autoscale_view()
+    
+    def _draw_nodes(self, ax, node_color, node_size: int, alpha: float) -> None:
+        """
+        Dessine tous les nœuds en un seul appel à scatter
+        
+        Args:
+            ax: Axes matplotlib
+            node_color: Couleur unique ou une couleur par nœud
+            node_size: Taille des nœuds
+            alpha: Transparence
+        """
+        ax.scatter(self._node_array[:, 0], self._node_array[:, 1],
+                   c=node_color, s=node_size, alpha=alpha, zorder=2)
+    
+    def _draw_labels(self, ax, graph: nx.Graph, font_size: int, 
+                     font_weight: str = 'normal', font_color: str = 'white') -> None:
+        """
+        Dessine les étiquettes des nœuds (omises pour les grands graphes)
+        
+        Args:
+            ax: Axes matplotlib
+            graph: Graphe NetworkX
+            font_size: Taille de police
+            font_weight: Graisse de la police
+            font_color: Couleur du texte
+        """
+        if graph.number_of_nodes() > self.max_labeled_nodes:
+            return
+        
+        for node, (x, y) in zip(graph.nodes(), self._node_array):
+            ax.text(x, y, str(node), fontsize=font_size, fontweight=font_weight,
+                    color=font_color, ha='center', va='center', zorder=3)
+    
     def draw_graph_basic(self, graph: nx.Graph, layout_type: str = 'spring') -> None:
         """
         Dessine le graphe de base
@@ -94,19 +259,15 @@ class GraphVisualizer:
         self.calculate_layout(graph, layout_type)
         
         # Dessin des arêtes
-        nx.draw_networkx_edges(graph, self.pos,
-                              edge_color=self.color_scheme['edge_default'],
-                              width=1.5, alpha=0.6, ax=self.ax)
+        self._draw_edges(self.ax, graph, self.color_scheme['edge_default'],
+                         width=1.5, alpha=0.6)
         
         # Dessin des nœuds
-        nx.draw_networkx_nodes(graph, self.pos,
-                              node_color=self.color_scheme['node_default'],
-                              node_size=500, alpha=0.8, ax=self.ax)
+        self._draw_nodes(self.ax, self.color_scheme['node_default'],
+                         node_size=500, alpha=0.8)
         
         # Étiquettes des nœuds
-        nx.draw_networkx_labels(graph, self.pos,
-                               font_size=10, font_weight='bold',
-                               font_color='white', ax=self.ax)
+        self._draw_labels(self.ax, graph, font_size=10, font_weight='bold')
         
         # Informations sur le graphe
         info_text = f"Nœuds: {graph.number_of_nodes()} | Arêtes: {graph.number_of_edges()}\n"
@@ -117,7 +278,7 @@ class GraphVisualizer:
                     bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.7))
     
     def draw_connectivity_analysis(self, graph: nx.Graph, results: Dict, 
-                                  layout_type: str = 'spring') -> None:
+                                  layout_type: str = 'spring', force: bool = False) -> None:
         """
         Dessine le graphe avec l'analyse de connexité
         
@@ -125,47 +286,38 @@ class GraphVisualizer:
             graph: Graphe NetworkX
             results: Résultats de l'analyse de connexité
             layout_type: Type de layout
+            force: True pour recalculer la disposition même si elle est déjà connue
         """
         if not self.fig:
             self.setup_plot()
         
-        # Calcul de la disposition
-        self.calculate_layout(graph, layout_type)
+        # Disposition reprise du cache si ce graphe a déjà été dessiné
+        self.calculate_layout(graph, layout_type, force=force)
         
-        # Récupération des coupes
+        # Récupération des coupes (arêtes sous forme canonique, sans orientation)
         node_cut = set(results['cuts']['minimum_node_cut'])
-        edge_cut = set(results['cuts']['minimum_edge_cut'])
+        edge_cut = {frozenset(edge) for edge in results['cuts']['minimum_edge_cut']}
         
         # Couleurs des nœuds
-        node_colors = []
-        for node in graph.nodes():
-            if node in node_cut:
-                node_colors.append(self.color_scheme['node_cut'])
-            else:
-                node_colors.append(self.color_scheme['node_default'])
+        node_mask = np.fromiter((node in node_cut for node in graph.nodes()),
+                                dtype=bool, count=graph.number_of_nodes())
+        node_colors = np.where(node_mask[:, None], self._rgba['node_cut'],
+                               self._rgba['node_default'])
         
         # Couleurs des arêtes
-        edge_colors = []
-        for edge in graph.edges():
-            if edge in edge_cut or (edge[1], edge[0]) in edge_cut:
-                edge_colors.append(self.color_scheme['edge_cut'])
-            else:
-                edge_colors.append(self.color_scheme['edge_default'])
+        edge_mask = np.fromiter((frozenset(edge) in edge_cut for edge in graph.edges()),
+                                dtype=bool, count=graph.number_of_edges())
+        edge_colors = np.where(edge_mask[:, None], self._rgba['edge_cut'],
+                               self._rgba['edge_default'])
         
         # Dessin des arêtes
-        nx.draw_networkx_edges(graph, self.pos,
-                              edge_color=edge_colors,
-                              width=2, alpha=0.7, ax=self.ax)
+        self._draw_edges(self.ax, graph, edge_colors, width=2, alpha=0.7)
         
         # Dessin des nœuds
-        nx.draw_networkx_nodes(graph, self.pos,
-                              node_color=node_colors,
-                              node_size=600, alpha=0.9, ax=self.ax)
+        self._draw_nodes(self.ax, node_colors, node_size=600, alpha=0.9)
         
         # Étiquettes des nœuds
-        nx.draw_networkx_labels(graph, self.pos,
-                               font_size=10, font_weight='bold',
-                               font_color='white', ax=self.ax)
+        self._draw_labels(self.ax, graph, font_size=10, font_weight='bold')
         
         # Légende
         self._add_connectivity_legend(results)
@@ -222,54 +374,43 @@ class GraphVisualizer:
             max_k: Valeur maximale de k à afficher
         """
         # Configuration de la figure avec sous-graphiques
-        fig, axes = plt.subplots(2, min(max_k, 3), figsize=(15, 10))
-        if max_k == 1:
-            axes = [axes]
-        elif max_k <= 3:
-            axes = axes.flatten()
+        fig, axes = plt.subplots(2, min(max_k, 3), figsize=(15, 10), squeeze=False)
+        axes = axes.ravel()
         
         fig.suptitle('Comparaison K-Connexité', fontsize=16, fontweight='bold')
         
-        # Calcul de la disposition commune
-        pos = nx.spring_layout(graph, k=3, iterations=50, seed=42)
+        # Disposition commune, partagée avec les autres visualisations
+        pos = self.calculate_layout(graph, 'spring')
+        
+        # Géométrie des arêtes construite une seule fois, clonée pour chaque k
+        base_edges = None
+        if not graph.is_directed():
+            base_edges = LineCollection(self._edge_segments(graph),
+                                        linewidths=1.5, alpha=0.7, zorder=1)
         
         node_conn = results['connectivity']['node_connectivity']
         edge_conn = results['connectivity']['edge_connectivity']
         
         for i, k in enumerate(range(1, min(max_k + 1, len(axes) + 1))):
-            if i >= len(axes):
-                break
-                
-            ax = axes[i] if hasattr(axes, '__len__') else axes
-            
-            # Couleurs selon la k-connexité
-            node_colors = []
-            edge_colors = []
+            ax = axes[i]
             
             k_node_connected = k <= node_conn
             k_edge_connected = k <= edge_conn
             
-            # Nœuds
-            for node in graph.nodes():
-                if k_node_connected:
-                    node_colors.append('#2ECC71')  # Vert pour connexe
-                else:
-                    node_colors.append('#E74C3C')  # Rouge pour non-connexe
-            
-            # Arêtes
-            for edge in graph.edges():
-                if k_edge_connected:
-                    edge_colors.append('#27AE60')  # Vert foncé pour connexe
-                else:
-                    edge_colors.append('#C0392B')  # Rouge foncé pour non-connexe
+            # Couleurs selon la k-connexité (uniformes pour un k donné)
+            node_color = '#2ECC71' if k_node_connected else '#E74C3C'
+            edge_color = '#27AE60' if k_edge_connected else '#C0392B'
             
             # Dessin
-            nx.draw_networkx_edges(graph, pos, edge_color=edge_colors,
-                                  width=1.5, alpha=0.7, ax=ax)
-            nx.draw_networkx_nodes(graph, pos, node_color=node_colors,
-                                  node_size=300, alpha=0.8, ax=ax)
-            nx.draw_networkx_labels(graph, pos, font_size=8, 
-                                   font_color='white', ax=ax)
+            if base_edges is not None:
+                edges = copy.copy(base_edges)
+                edges.set_color(edge_color)
+                ax.add_collection(edges)
+                ax.autoscale_view()
+            else:
+                self._draw_edges(ax, graph, edge_color, width=1.5, alpha=0.7)
+            self._draw_nodes(ax, node_color, node_size=300, alpha=0.8)
+            self._draw_labels(ax, graph, font_size=8)
             
             # Titre et informations
             status_node = "✓" if k_node_connected else "✗"
@@ -280,9 +421,8 @@ class GraphVisualizer:
             ax.axis('off')
         
         # Masquer les axes inutilisés
-        for i in range(min(max_k, len(axes)), len(axes)):
-            if hasattr(axes, '__len__') and i < len(axes):
-                axes[i].axis('off')
+        for ax in axes[min(max_k, len(axes)):]:
+            ax.axis('off')
         
         plt.tight_layout()
         self.fig = fig
@@ -300,8 +440,19 @@ class GraphVisualizer:
         """
         try:
             if self.fig:
-                self.fig.savefig(filepath, dpi=dpi, bbox_inches='tight', 
-                               facecolor=self.color_scheme['background'])
+                # Cadrage calculé depuis les positions plutôt que par bbox_inches='tight',
+                # qui impose un rendu supplémentaire pour mesurer la figure
+                if self.ax is not None and self._xy_bounds is not None:
+                    xmin, xmax, ymin, ymax = self._xy_bounds
+                    pad = 0.1 * max(xmax - xmin, ymax - ymin) or 0.1
+                    self.ax.set_xlim(xmin - pad, xmax + pad)
+                    self.ax.set_ylim(ymin - pad, ymax + pad)
+                
+                # Rendu Agg direct, sans passer par l'état de pyplot
+                canvas = self.fig.canvas
+                FigureCanvasAgg(self.fig).print_figure(filepath, dpi=dpi,
+                                                       facecolor=self.color_scheme['background'])
+                self.fig.set_canvas(canvas)
                 print(f"✓ Visualisation sauvegardée: {filepath}")
                 return True
             else:
@@ -329,3 +480,6 @@ class GraphVisualizer:
         self.fig = None
         self.ax = None
         self.pos = None
+        self._node_array = None
+        self._index_of = {}
+        self._xy_bounds = None
@@ -3,71 +3,27 @@ Interface utilisateur principale pour l'analyse de k-connexité des graphes
 Programme modulaire avec interface fluide et intuitive
 """
 
-import os
+import importlib.util
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FuturesTimeout
+from itertools import combinations, islice, takewhile
+from pathlib import Path
 from typing import List, Tuple, Optional
 import networkx as nx
+import numpy as np
+from scipy.sparse.csgraph import connected_components
+
+# Moteur de calcul optionnel (bibliothèque C) pour les grands graphes, importé
+# à la demande : son module de dessin charge matplotlib.pyplot
+ig = None
 
 # Import des modules locaux
-from graph_connectivity import GraphConnectivityAnalyzer
-from graph_visualizer import GraphVisualizer
+from graph_connectivity import GraphConnectivityAnalyzer, ConnectivityResults, _structure_key
 
-class GraphConnectivityInterface:
-    """
-    Interface utilisateur principale pour l'analyse de k-connexité
-    """
-    
-    def __init__(self):
-        """
-        Initialise l'interface
-        """
-        self.analyzer = GraphConnectivityAnalyzer()
-        self.visualizer = GraphVisualizer()
-        self.current_graph = None
-        self.current_results = None
-        
-        # Configuration
-        self.supported_formats = ['edgelist', 'gml', 'graphml', 'adjlist']
-        self.example_graphs = self._create_example_graphs()
-    
-    def _create_example_graphs(self) -> dict:
-        """
-        Crée des graphes d'exemple pour les démonstrations
-        
-        Returns:
-            dict: Dictionnaire des graphes d'exemple
-        """
-        examples = {}
-        
-        # Graphe complet K4
-        examples['K4'] = nx.complete_graph(4)
-        
-        # Cycle C5
-        examples['C5'] = nx.cycle_graph(5)
-        
-        # Graphe en étoile
-        examples['star'] = nx.star_graph(5)
-        
-        # Graphe de Petersen
-        examples['petersen'] = nx.petersen_graph()
-        
-        # Graphe avec pont
-        bridge_graph = nx.Graph()
-        bridge_graph.add_edges_from([(0, 1), (1, 2), (2, 3), (3, 4), (4, 1), (2, 5), (5, 6), (6, 7), (7, 8), (8, 5)])
-        examples['bridge'] = bridge_graph
-        
-        # Graphe non connexe
-        disconnected = nx.Graph()
-        disconnected.add_edges_from([(0, 1), (1, 2), (2, 0), (3, 4), (4, 5)])
-        examples['disconnected'] = disconnected
-        
-        return examples
-    
-    def display_welcome(self) -> None:
-        """
-        Affiche le message d'accueil et le guide
-        """
-        welcome_text = """
+WELCOME_TEXT = """
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                          ANALYSEUR DE K-CONNEXITÉ                           ║
 ║                     Analyse complète des graphes NetworkX                    ║
@@ -100,16 +56,12 @@ class GraphConnectivityInterface:
    • Petersen: Graphe de Petersen
    • Bridge: Graphe avec pont
    • Disconnected: Graphe non connexe
+   • Kn: Graphe complet, taille au choix
 
 ═══════════════════════════════════════════════════════════════════════════════
 """
-        print(welcome_text)
-    
-    def display_menu(self) -> None:
-        """
-        Affiche le menu principal
-        """
-        menu_text = """
+
+MENU_TEXT = """
 ┌─────────────────── MENU PRINCIPAL ───────────────────┐
 │                                                      │
 │  1. 📁 Charger un graphe depuis un fichier          │
@@ -122,11 +74,250 @@ class GraphConnectivityInterface:
 │  8. 💾 Exporter les résultats                       │
 │  9. ℹ️  Informations sur le graphe actuel           │
 │  10. 🆘 Aide détaillée                              │
+│  11. ⚙️  Moteur de calcul (networkx / igraph)       │
+│  12. ⏳ État de l'analyse en arrière-plan           │
 │  0. 🚪 Quitter                                       │
 │                                                      │
 └──────────────────────────────────────────────────────┘
         """
-        print(menu_text)
+
+HELP_TEXT = """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                                AIDE DÉTAILLÉE                                ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+🔍 CONCEPTS DE K-CONNEXITÉ:
+
+📌 Connexité par nœuds κ(G):
+   • Nombre minimum de nœuds à supprimer pour déconnecter le graphe
+   • Un graphe est k-connexe par nœuds si κ(G) ≥ k
+
+📌 Connexité par arêtes λ(G):
+   • Nombre minimum d'arêtes à supprimer pour déconnecter le graphe
+   • Un graphe est k-connexe par arêtes si λ(G) ≥ k
+
+📌 Relation fondamentale:
+   • κ(G) ≤ λ(G) ≤ δ(G) où δ(G) est le degré minimum
+
+🛠️ UTILISATION DU PROGRAMME:
+
+1️⃣ CHARGEMENT DE GRAPHES:
+   • Fichiers EdgeList: une arête par ligne (format: nœud1 nœud2)
+   • Fichiers GML/GraphML: formats standard NetworkX
+   • Création manuelle: saisie interactive des arêtes
+   • Graphes d'exemple: collection de graphes classiques
+
+2️⃣ ANALYSE:
+   • Calcul automatique de κ(G) et λ(G)
+   • Identification des coupes minimales
+   • Test de k-connexité pour différentes valeurs de k
+
+3️⃣ VISUALISATION:
+   • Graphe de base avec différents layouts
+   • Visualisation des coupes minimales (nœuds/arêtes en rouge)
+   • Comparaison visuelle pour différentes valeurs de k
+
+4️⃣ EXPORT:
+   • JSON: données complètes pour traitement ultérieur
+   • TXT: résumé lisible pour rapport
+
+💡 CONSEILS:
+   • Utilisez les graphes d'exemple pour vous familiariser
+   • Pour de gros graphes, limitez la valeur maximale de k
+   • La visualisation est optimale pour des graphes < 50 nœuds
+   • Les calculs peuvent être longs pour des graphes très denses
+
+❓ INTERPRÉTATION DES RÉSULTATS:
+   • κ(G) = 0: graphe non connexe ou trivial
+   • κ(G) = 1: graphe connexe avec points d'articulation
+   • κ(G) ≥ 2: graphe robuste, pas de point de défaillance unique
+   • Plus κ(G) et λ(G) sont élevés, plus le graphe est robuste
+
+═══════════════════════════════════════════════════════════════════════════════
+        """
+
+# Écrans constants encodés une seule fois (print ajoute un saut de ligne final)
+_WELCOME_BYTES = (WELCOME_TEXT + "\n").encode('utf-8')
+_MENU_BYTES = (MENU_TEXT + "\n").encode('utf-8')
+_HELP_BYTES = (HELP_TEXT + "\n").encode('utf-8')
+
+def _write_bytes(data: bytes) -> None:
+    """
+    Écrit un texte pré-encodé directement sur la sortie standard binaire
+    
+    Args:
+        data: Texte encodé en UTF-8
+    """
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        # Sortie sans couche binaire (console embarquée, redirection en mémoire)
+        sys.stdout.write(data.decode('utf-8'))
+        return
+    sys.stdout.flush()  # Conserve l'ordre avec les print précédents
+    buffer.write(data)
+    buffer.flush()
+
+def _read_line(prompt: str = '') -> str:
+    """
+    Équivalent de input() pour une entrée redirigée : lecture directe de
+    sys.stdin, sans initialisation du module readline
+    
+    Args:
+        prompt: Invite affichée avant la lecture
+    
+    Returns:
+        str: Ligne lue, sans le saut de ligne final
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError  # Même comportement que input() en fin de flux
+    return line.rstrip('\n')
+
+# Saisie interactive sur un terminal, lecture directe pour une entrée redirigée
+_prompt = input if sys.stdin is not None and sys.stdin.isatty() else _read_line
+
+def _import_igraph():
+    """
+    Importe igraph à la première demande
+    
+    Returns:
+        module: Le module igraph, ou None s'il n'est pas installé
+    """
+    global ig
+    if ig is None:
+        try:
+            import igraph
+        except ImportError:
+            return None
+        ig = igraph
+    return ig
+
+class GraphConnectivityInterface:
+    """
+    Interface utilisateur principale pour l'analyse de k-connexité
+    """
+    
+    # Graphes d'exemple et lignes du menu préformatées (nœuds, arêtes, connexité) :
+    # le menu s'affiche sans construire les graphes
+    _EXAMPLE_NAMES = ('K4', 'C5', 'star', 'petersen', 'bridge', 'disconnected')
+    _EXAMPLE_META = (
+        ('K4', 'K4: 4 nœuds, 6 arêtes (Connexe)'),
+        ('C5', 'C5: 5 nœuds, 5 arêtes (Connexe)'),
+        ('star', 'star: 6 nœuds, 5 arêtes (Connexe)'),
+        ('petersen', 'petersen: 10 nœuds, 15 arêtes (Connexe)'),
+        ('bridge', 'bridge: 9 nœuds, 10 arêtes (Connexe)'),
+        ('disconnected', 'disconnected: 6 nœuds, 5 arêtes (Non connexe)')
+    )
+    
+    def __init__(self):
+        """
+        Initialise l'interface
+        """
+        self.analyzer = GraphConnectivityAnalyzer()
+        self._visualizer = None  # Créé à la première visualisation (import de matplotlib)
+        self.current_graph = None
+        self.current_results = None
+        
+        # Connexité mémorisée par graphe (id), invalidée à chaque changement de graphe
+        self._conn_cache = {}
+        self.scipy_connectivity_min_nodes = 5000  # Seuil du test de connexité via SciPy
+        
+        # Moteur de calcul de la connexité ('networkx' ou 'igraph')
+        self.engine = 'networkx'
+        
+        # Résultats d'analyse (copies détachées) indexés par (empreinte du graphe,
+        # moteur, max_k), les moins récemment utilisés évincés au-delà de
+        # results_cache_size ; l'empreinte n'est calculée qu'à la première analyse
+        self._graph_fp = None
+        self._kconn_cache = OrderedDict()
+        self.results_cache_size = 32
+        self._graph_stats = None
+        
+        # Analyses exécutées dans des fils démons (abandonnés à la sortie) ;
+        # _pending : analyses interrompues par Ctrl-C qui se poursuivent en
+        # arrière-plan, indexées par (empreinte du graphe, moteur, max_k)
+        self._pending = {}
+        
+        # Configuration
+        self.supported_formats = ['edgelist', 'gml', 'graphml', 'adjlist']
+        self.example_graphs = self._create_example_graphs()
+        self._example_cache = {}
+        
+        # Table de dispatch du menu principal ('0' : quitter)
+        self._menu_dispatch = {
+            '0': None,
+            '1': self.load_graph_from_file,
+            '2': self.create_graph_manually,
+            '3': self.use_example_graph,
+            '4': self.analyze_connectivity,
+            '5': self.visualize_graph,
+            '6': self.visualize_connectivity,
+            '7': self.visualize_k_comparison,
+            '8': self.export_results,
+            '9': self._display_graph_info,
+            '10': self.display_help,
+            '11': self.toggle_engine,
+            '12': self.analysis_status
+        }
+    
+    @property
+    def visualizer(self):
+        """
+        Visualiseur, instancié à la première utilisation pour ne pas importer
+        matplotlib au démarrage
+        
+        Returns:
+            GraphVisualizer: Visualiseur de l'interface
+        """
+        if self._visualizer is None:
+            from graph_visualizer import GraphVisualizer
+            self._visualizer = GraphVisualizer()
+        return self._visualizer
+    
+    def _create_example_graphs(self) -> dict:
+        """
+        Déclare les graphes d'exemple pour les démonstrations ; chaque graphe
+        n'est construit qu'à sa première sélection
+        
+        Returns:
+            dict: Dictionnaire nom -> fonction de construction du graphe
+        """
+        examples = {}
+        
+        # Graphe complet K4
+        examples['K4'] = lambda: nx.complete_graph(4)
+        
+        # Cycle C5
+        examples['C5'] = lambda: nx.cycle_graph(5)
+        
+        # Graphe en étoile
+        examples['star'] = lambda: nx.star_graph(5)
+        
+        # Graphe de Petersen
+        examples['petersen'] = nx.petersen_graph
+        
+        # Graphe avec pont
+        examples['bridge'] = lambda: nx.Graph([(0, 1), (1, 2), (2, 3), (3, 4), (4, 1), (2, 5),
+                                               (5, 6), (6, 7), (7, 8), (8, 5)])
+        
+        # Graphe non connexe
+        examples['disconnected'] = lambda: nx.Graph([(0, 1), (1, 2), (2, 0), (3, 4), (4, 5)])
+        
+        return examples
+    
+    def display_welcome(self) -> None:
+        """
+        Affiche le message d'accueil et le guide
+        """
+        _write_bytes(_WELCOME_BYTES)
+    
+    def display_menu(self) -> None:
+        """
+        Affiche le menu principal
+        """
+        _write_bytes(_MENU_BYTES)
     
     def load_graph_from_file(self) -> bool:
         """
@@ -140,19 +331,30 @@ class GraphConnectivityInterface:
         print("="*60)
         
         # Demande du chemin du fichier
-        filepath = input("\n📁 Chemin vers le fichier: ").strip()
+        filepath = _prompt("\n📁 Chemin vers le fichier: ").strip()
+        if not filepath:
+            # Path('') désignerait le répertoire courant
+            print("❌ Aucun chemin de fichier saisi.")
+            return False
         
-        if not os.path.exists(filepath):
+        # Un seul appel système pour vérifier que le chemin désigne un fichier
+        path = Path(filepath)
+        try:
+            is_file = path.is_file()
+        except OSError as e:
+            print(f"❌ Fichier inaccessible: {e}")
+            return False
+        if not is_file:
             print(f"❌ Fichier non trouvé: {filepath}")
             return False
         
         # Détection automatique du format ou demande à l'utilisateur
         print(f"\n🔍 Formats supportés: {', '.join(self.supported_formats)}")
-        format_choice = input("📋 Format du fichier (auto-détection si vide): ").strip().lower()
+        format_choice = _prompt("📋 Format du fichier (auto-détection si vide): ").strip().lower()
         
         if not format_choice:
             # Auto-détection basée sur l'extension
-            ext = os.path.splitext(filepath)[1].lower()
+            ext = path.suffix.lower()
             format_mapping = {
                 '.txt': 'edgelist',
                 '.edgelist': 'edgelist',
@@ -164,10 +366,10 @@ class GraphConnectivityInterface:
             print(f"🤖 Format détecté: {format_choice}")
         
         # Chargement
-        success = self.analyzer.load_graph_from_file(filepath, format_choice)
+        success = self.analyzer.load_graph_from_file(str(path), format_choice)
         
         if success:
-            self.current_graph = self.analyzer.graph
+            self._set_current_graph(self.analyzer.graph)
             print(f"✅ Graphe chargé avec succès!")
             self._display_graph_info()
         
@@ -189,16 +391,102 @@ class GraphConnectivityInterface:
         print("   1. Non orienté (par défaut)")
         print("   2. Orienté")
         
-        graph_type = input("\n📋 Choisissez le type (1 ou 2): ").strip()
+        graph_type = _prompt("\n📋 Choisissez le type (1 ou 2): ").strip()
         directed = (graph_type == '2')
         
         print(f"\n📝 Saisie des arêtes pour un graphe {'orienté' if directed else 'non orienté'}")
         print("   Format: nœud1 nœud2 (exemple: A B)")
         print("   Tapez 'fin' pour terminer")
         
+        if not sys.stdin.isatty():
+            # Entrée redirigée : lecture groupée des lignes jusqu'à 'fin' (ou fin de flux),
+            # le reste du flux restant disponible pour les menus suivants
+            lines = takewhile(lambda line: line.strip().lower() != 'fin',
+                              iter(sys.stdin.readline, ''))
+            rows = [line.split() for line in lines if line.strip()]
+            pairs = [parts for parts in rows if len(parts) == 2]
+            edges = self._parse_edges(pairs)
+            if len(edges) < len(rows):
+                print(f"⚠️ {len(rows) - len(edges)} ligne(s) ignorée(s) (format: nœud1 nœud2)")
+            print(f"📥 {len(edges)} arête(s) lue(s) depuis l'entrée standard")
+        else:
+            edges = self._read_edges_interactive()
+        
+        if not edges:
+            print("❌ Aucune arête saisie.")
+            return False
+        
+        # Création du graphe
+        success = self.analyzer.create_graph_from_edges(edges, directed)
+        
+        if success:
+            self._set_current_graph(self.analyzer.graph)
+            print(f"✅ Graphe créé avec succès!")
+            self._display_graph_info()
+        
+        return success
+    
+    @staticmethod
+    def _parse_edge(parts: List[str]) -> Tuple:
+        """
+        Convertit les deux extrémités d'une arête saisie
+        
+        Args:
+            parts: Extrémités sous forme de chaînes
+        
+        Returns:
+            Tuple: Arête (entiers si possible, sinon chaînes)
+        """
+        # Conversion en entier si possible, sinon garde comme string
+        if GraphConnectivityInterface._is_int(parts[0]) and GraphConnectivityInterface._is_int(parts[1]):
+            return int(parts[0]), int(parts[1])
+        return parts[0], parts[1]
+    
+    @staticmethod
+    def _is_int(token: str) -> bool:
+        """
+        Teste sans exception si une chaîne représente un entier (signe facultatif)
+        
+        Args:
+            token: Chaîne à tester
+        
+        Returns:
+            bool: True si int(token) réussit
+        """
+        return token[1:].isdecimal() if token[:1] in ('-', '+') else token.isdecimal()
+    
+    @staticmethod
+    def _parse_edges(pairs: List[List[str]]) -> List[Tuple]:
+        """
+        Convertit un lot d'arêtes saisies, le test d'entier étant fait par NumPy
+        sur toutes les extrémités à la fois
+        
+        Args:
+            pairs: Arêtes sous forme de paires de chaînes
+        
+        Returns:
+            List[Tuple]: Arêtes (entiers si possible, sinon chaînes)
+        """
+        if not pairs:
+            return []
+        
+        tokens = np.array(pairs, dtype=str)
+        # Un seul signe au plus, en tête : lstrip puis comptage
+        signs = np.char.count(tokens, '-') + np.char.count(tokens, '+')
+        is_int = np.char.isdecimal(np.char.lstrip(tokens, '-+')) & (signs <= 1)
+        both_int = is_int.all(axis=1)
+        return [(int(u), int(v)) if ok else (u, v) for (u, v), ok in zip(pairs, both_int.tolist())]
+    
+    def _read_edges_interactive(self) -> List[Tuple]:
+        """
+        Saisie interactive des arêtes, une par invite, jusqu'à 'fin'
+        
+        Returns:
+            List[Tuple]: Arêtes saisies
+        """
         edges = []
         while True:
-            edge_input = input(f"\n🔗 Arête {len(edges) + 1}: ").strip()
+            edge_input = _prompt(f"\n🔗 Arête {len(edges) + 1}: ").strip()
             
             if edge_input.lower() == 'fin':
                 break
@@ -209,33 +497,14 @@ class GraphConnectivityInterface:
                     print("❌ Format incorrect. Utilisez: nœud1 nœud2")
                     continue
                 
-                # Conversion en entier si possible, sinon garde comme string
-                try:
-                    node1 = int(parts[0])
-                    node2 = int(parts[1])
-                except ValueError:
-                    node1 = parts[0]
-                    node2 = parts[1]
-                
+                node1, node2 = self._parse_edge(parts)
                 edges.append((node1, node2))
                 print(f"✅ Arête ajoutée: {node1} -- {node2}")
                 
             except Exception as e:
                 print(f"❌ Erreur: {e}")
         
-        if not edges:
-            print("❌ Aucune arête saisie.")
-            return False
-        
-        # Création du graphe
-        success = self.analyzer.create_graph_from_edges(edges, directed)
-        
-        if success:
-            self.current_graph = self.analyzer.graph
-            print(f"✅ Graphe créé avec succès!")
-            self._display_graph_info()
-        
-        return success
+        return edges
     
     def use_example_graph(self) -> bool:
         """
@@ -248,25 +517,36 @@ class GraphConnectivityInterface:
         print("              GRAPHES D'EXEMPLE")
         print("="*60)
         
-        print("\n📚 Graphes disponibles:")
-        examples_list = list(self.example_graphs.keys())
+        lines = ["\n📚 Graphes disponibles:"]
         
-        for i, (name, graph) in enumerate(self.example_graphs.items(), 1):
-            n_nodes = graph.number_of_nodes()
-            n_edges = graph.number_of_edges()
-            connected = "Connexe" if nx.is_connected(graph) else "Non connexe"
-            print(f"   {i}. {name}: {n_nodes} nœuds, {n_edges} arêtes ({connected})")
+        for i, (_, line) in enumerate(self._EXAMPLE_META, 1):
+            lines.append(f"   {i}. {line}")
+        n_choices = len(self._EXAMPLE_NAMES) + 1
+        lines.append(f"   {n_choices}. Kn: graphe complet à n nœuds (n au choix)")
+        print("\n".join(lines))
         
         try:
-            choice = int(input(f"\n🎯 Choisissez un graphe (1-{len(examples_list)}): "))
+            choice = int(_prompt(f"\n🎯 Choisissez un graphe (1-{n_choices}): "))
             
-            if 1 <= choice <= len(examples_list):
-                selected_name = examples_list[choice - 1]
-                selected_graph = self.example_graphs[selected_name].copy()
+            if 1 <= choice <= n_choices:
+                if choice == n_choices:
+                    n = int(_prompt("🔢 Nombre de nœuds n: "))
+                    if n < 1:
+                        print("❌ n doit être au moins 1.")
+                        return False
+                    selected_name = f"K{n}"
+                    build = lambda: nx.complete_graph(n)
+                else:
+                    selected_name = self._EXAMPLE_NAMES[choice - 1]
+                    build = self.example_graphs[selected_name]
+                
+                if selected_name not in self._example_cache:
+                    self._example_cache[selected_name] = build()
+                selected_graph = self._example_cache[selected_name].copy()
                 
                 # Configuration de l'analyseur
                 self.analyzer.graph = selected_graph
-                self.current_graph = selected_graph
+                self._set_current_graph(selected_graph)
                 
                 print(f"✅ Graphe '{selected_name}' sélectionné!")
                 self._display_graph_info()
@@ -298,7 +578,7 @@ class GraphConnectivityInterface:
         max_k = self.current_graph.number_of_nodes()
         print(f"\n🔧 Valeur maximale de k recommandée: {max_k}")
         
-        user_max_k = input(f"📊 Valeur maximale de k à analyser (défaut: {max_k}): ").strip()
+        user_max_k = _prompt(f"📊 Valeur maximale de k à analyser (défaut: {max_k}): ").strip()
         
         if user_max_k:
             try:
@@ -310,9 +590,26 @@ class GraphConnectivityInterface:
         print("\n🔄 Analyse en cours...")
         
         try:
-            self.current_results = self.analyzer.k_connectivity_analysis(max_k)
+            key = (self._graph_fingerprint(), self.engine, max_k)
+            if key in self._kconn_cache:
+                # Même graphe déjà analysé avec ce moteur et ce max_k : copie
+                # rattachée à l'analyseur du graphe courant
+                self._kconn_cache.move_to_end(key)
+                results = self._kconn_cache[key]._copy_for(self.analyzer)
+            else:
+                # Analyse identique déjà poursuivie en arrière-plan : reprise de son attente
+                future = self._pending.pop(key, None)
+                if future is None:
+                    future = self._start_analysis(self.current_graph, max_k)
+                results = self._wait_for_analysis(future, key)
+                if results is None:
+                    return False
             
+            self.current_results = results
             if self.current_results:
+                self._cache_results(key, self.current_results)
+                # Résumé et export passent par l'analyseur
+                self.analyzer.connectivity_results = self.current_results
                 print("✅ Analyse terminée!")
                 print("\n" + self.analyzer.get_summary())
                 return True
@@ -324,6 +621,293 @@ class GraphConnectivityInterface:
             print(f"❌ Erreur lors de l'analyse: {e}")
             return False
     
+    def _start_analysis(self, G: nx.Graph, max_k: int) -> Future:
+        """
+        Lance l'analyse d'un graphe dans un fil démon, qui n'empêche pas la
+        sortie du programme s'il est encore en cours
+        
+        Args:
+            G: Graphe à analyser
+            max_k: Valeur maximale de k à tester
+        
+        Returns:
+            Future: Résultats à venir de l'analyse
+        """
+        future = Future()
+        # Paramètres figés au lancement : le fil ne lit plus l'état de l'interface
+        engine = self.engine
+        scipy_min_nodes = self.scipy_connectivity_min_nodes
+        
+        def worker():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(self._compute_results(G, max_k, engine, scipy_min_nodes))
+            except BaseException as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=worker, name='k-connectivity', daemon=True).start()
+        return future
+    
+    @classmethod
+    def _compute_results(cls, G: nx.Graph, max_k: int, engine: str,
+                         scipy_min_nodes: int) -> ConnectivityResults:
+        """
+        Calcule l'analyse de k-connexité d'un graphe avec le moteur adapté ;
+        exécutée en arrière-plan, elle ne dépend que de ses arguments
+        
+        Args:
+            G: Graphe à analyser
+            max_k: Valeur maximale de k à tester
+            engine: Moteur de calcul ('networkx' ou 'igraph')
+            scipy_min_nodes: Seuil du test de connexité via SciPy
+        
+        Returns:
+            ConnectivityResults: Résultats de l'analyse
+        """
+        known = cls._trivial_connectivity(G, scipy_min_nodes)
+        if known is not None:
+            # Graphe complet, cycle ou arbre (connexe par construction) : le nœud
+            # de degré minimum et ses voisins fournissent directement les coupes minimales
+            node, _ = min(G.degree(), key=lambda item: item[1])
+            return cls._build_results(G, True, known, known, max_k,
+                                      list(G[node]), list(G.edges(node)))
+        
+        if engine == 'igraph' and not G.is_directed():
+            return cls._igraph_analysis(G, max_k, cls._test_connected(G, scipy_min_nodes))
+        # Analyseur dédié : un changement de graphe pendant le calcul ne touche pas self.analyzer
+        return GraphConnectivityAnalyzer(G).k_connectivity_analysis(max_k)
+    
+    def _wait_for_analysis(self, future: Future, key: Tuple) -> Optional[ConnectivityResults]:
+        """
+        Attend une analyse lancée en arrière-plan en affichant un indicateur
+        d'activité ; Ctrl-C annule l'analyse, ou la laisse se poursuivre en
+        arrière-plan si elle a déjà démarré
+        
+        Args:
+            future: Analyse lancée par _start_analysis
+            key: Clé (empreinte du graphe, moteur, max_k) de l'analyse
+        
+        Returns:
+            Optional[ConnectivityResults]: Résultats, ou None si l'attente est interrompue
+        """
+        spinner = '⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏'
+        show = sys.stdout.isatty()
+        start = time.perf_counter()
+        ticks = 0
+        
+        try:
+            while True:
+                try:
+                    results = future.result(timeout=0.5)
+                    break
+                except FuturesTimeout:
+                    if show:
+                        sys.stdout.write(f"\r{spinner[ticks % len(spinner)]} "
+                                         f"{time.perf_counter() - start:.1f} s (Ctrl-C pour interrompre)")
+                        sys.stdout.flush()
+                    ticks += 1
+        except KeyboardInterrupt:
+            if future.cancel():
+                print("\n⛔ Analyse annulée.")
+            else:
+                self._pending[key] = future
+                print("\n⏳ L'analyse se poursuit en arrière-plan (menu 12 pour suivre son état).")
+            return None
+        
+        if show and ticks:
+            sys.stdout.write("\r" + " " * 50 + "\r")
+        return results
+    
+    def analysis_status(self) -> None:
+        """
+        Affiche l'état des analyses poursuivies en arrière-plan et récupère les
+        résultats de celles qui sont terminées
+        """
+        if not self._pending:
+            print("ℹ️ Aucune analyse en arrière-plan.")
+            return
+        
+        done = [key for key, future in self._pending.items() if future.done()]
+        running = len(self._pending) - len(done)
+        if running:
+            print(f"⏳ {running} analyse(s) toujours en cours...")
+        
+        current = None
+        for key in done:
+            future = self._pending.pop(key)
+            try:
+                results = future.result()
+            except Exception as e:
+                print(f"❌ Erreur lors de l'analyse: {e}")
+                continue
+            
+            if not results:
+                print("❌ Erreur lors de l'analyse.")
+                continue
+            
+            self._cache_results(key, results)
+            if key[0] != self._graph_fingerprint():
+                print("✅ Analyse terminée (graphe différent du graphe actuel, résultats conservés en cache).")
+            else:
+                current = results
+        
+        if current is not None:
+            self.current_results = current
+            self.analyzer.connectivity_results = current
+            print("✅ Analyse terminée!")
+            print("\n" + self.analyzer.get_summary())
+    
+    @staticmethod
+    def _to_igraph(G: nx.Graph) -> Tuple:
+        """
+        Convertit un graphe NetworkX en graphe igraph
+        
+        Args:
+            G: Graphe NetworkX
+        
+        Returns:
+            Tuple: (graphe igraph, liste des nœuds NetworkX indexée par sommet igraph)
+        """
+        nodes = list(G.nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        h = ig.Graph(n=len(nodes), edges=[(index[u], index[v]) for u, v in G.edges()],
+                     directed=G.is_directed())
+        h.simplify(multiple=False, loops=True)
+        return h, nodes
+    
+    @classmethod
+    def _igraph_analysis(cls, G: nx.Graph, max_k: int, connected: bool) -> ConnectivityResults:
+        """
+        Analyse de k-connexité d'un graphe non orienté avec igraph
+        
+        Args:
+            G: Graphe à analyser
+            max_k: Valeur maximale de k à tester
+            connected: Connexité du graphe
+        
+        Returns:
+            ConnectivityResults: Résultats au même format que l'analyseur NetworkX
+        """
+        h, nodes = cls._to_igraph(G)
+        
+        node_conn = cls._igraph_vertex_connectivity(h)
+        mincut = h.mincut() if h.vcount() > 1 else None
+        edge_conn = int(mincut.value) if mincut is not None else 0
+        
+        # Coupe d'arêtes fournie par le mincut, ré-étiquetée avec les nœuds NetworkX ;
+        # la coupe de nœuds reste paresseuse (minimum_size_separators énumère tous
+        # les séparateurs minimaux, bien plus coûteux que l'analyseur)
+        edge_cut = ([] if edge_conn == 0 else
+                    [(nodes[e.source], nodes[e.target]) for e in h.es[mincut.cut]])
+        
+        return cls._build_results(G, connected, node_conn, edge_conn, max_k, None, edge_cut)
+    
+    @staticmethod
+    def _igraph_vertex_connectivity(h) -> int:
+        """
+        Connexité par nœuds κ(G) d'un graphe igraph non orienté par flots s-t :
+        un nœud v de degré minimum et ses non-voisins, puis les paires de voisins
+        non adjacents de v (h.vertex_connectivity() sans paire teste toutes les
+        paires de sommets)
+        
+        Args:
+            h: Graphe igraph non orienté
+        
+        Returns:
+            int: Connexité par nœuds
+        """
+        n = h.vcount()
+        if n <= 1:
+            return 0
+        
+        v = min(range(n), key=h.degree)
+        neighbors = set(h.neighbors(v)) - {v}
+        best = len(neighbors)
+        for w in range(n):
+            if w != v and w not in neighbors:
+                best = min(best, h.vertex_connectivity(v, w, neighbors='negative'))
+        for x, y in combinations(neighbors, 2):
+            if not h.are_adjacent(x, y):
+                best = min(best, h.vertex_connectivity(x, y, neighbors='negative'))
+        return best
+    
+    @staticmethod
+    def _build_results(G: nx.Graph, connected: bool, node_conn: int, edge_conn: int,
+                       max_k: int, node_cut: Optional[List], edge_cut: List) -> ConnectivityResults:
+        """
+        Assemble des résultats calculés hors de l'analyseur au format de celui-ci
+        
+        Args:
+            G: Graphe analysé
+            connected: Connexité du graphe
+            node_conn: Connexité par nœuds κ(G)
+            edge_conn: Connexité par arêtes λ(G)
+            max_k: Valeur maximale de k à tester
+            node_cut: Coupe minimale de nœuds (None : calculée au premier accès)
+            edge_cut: Coupe minimale d'arêtes
+        
+        Returns:
+            ConnectivityResults: Résultats de l'analyse
+        """
+        results = ConnectivityResults(
+            basic_info={
+                'nodes': G.number_of_nodes(),
+                'edges': G.number_of_edges(),
+                'is_connected': connected,
+                'is_directed': G.is_directed()
+            },
+            _node_conn=node_conn,
+            _edge_conn=edge_conn,
+            _max_k=max_k,
+            _graph=G,
+            _analyzer=GraphConnectivityAnalyzer(G)
+        )
+        if node_cut is not None:
+            results.minimum_node_cut = node_cut
+        results.minimum_edge_cut = edge_cut
+        return results
+    
+    @classmethod
+    def _trivial_connectivity(cls, G: nx.Graph, scipy_min_nodes: int) -> Optional[int]:
+        """
+        Reconnaît les graphes dont la connexité est connue analytiquement :
+        complet K_n (κ = λ = n-1), cycle (κ = λ = 2) et arbre (κ = λ = 1)
+        
+        Args:
+            G: Graphe non orienté simple
+            scipy_min_nodes: Seuil du test de connexité via SciPy
+        
+        Returns:
+            Optional[int]: κ(G) = λ(G) si le graphe est reconnu, None sinon
+        """
+        n = G.number_of_nodes()
+        m = G.number_of_edges()
+        if n < 2 or G.is_directed() or G.is_multigraph() or nx.number_of_selfloops(G):
+            return None
+        
+        if m == n * (n - 1) // 2:
+            return n - 1
+        if m == n - 1 and cls._test_connected(G, scipy_min_nodes):
+            return 1
+        if m == n and all(d == 2 for _, d in G.degree()) and cls._test_connected(G, scipy_min_nodes):
+            return 2
+        return None
+    
+    def toggle_engine(self) -> None:
+        """
+        Bascule le moteur de calcul de la connexité entre NetworkX et igraph
+        """
+        if _import_igraph() is None:
+            print("❌ igraph n'est pas installé (pip install igraph).")
+            return
+        
+        self.engine = 'igraph' if self.engine == 'networkx' else 'networkx'
+        self.current_results = None
+        print(f"✅ Moteur de calcul: {self.engine}")
+        if self.engine == 'igraph':
+            print("   (les graphes orientés restent analysés avec NetworkX)")
+    
     def visualize_graph(self) -> None:
         """
         Visualise le graphe de base
@@ -337,7 +921,7 @@ class GraphConnectivityInterface:
         # Options de layout
         layouts = ['spring', 'circular', 'random', 'shell']
         print(f"📐 Layouts disponibles: {', '.join(layouts)}")
-        layout_choice = input("🎯 Layout (défaut: spring): ").strip().lower()
+        layout_choice = _prompt("🎯 Layout (défaut: spring): ").strip().lower()
         
         if layout_choice not in layouts:
             layout_choice = 'spring'
@@ -388,7 +972,7 @@ class GraphConnectivityInterface:
         
         print("\n🎨 Génération de la comparaison k-connexité...")
         
-        max_k_display = input("📊 Nombre de valeurs k à comparer (défaut: 5): ").strip()
+        max_k_display = _prompt("📊 Nombre de valeurs k à comparer (défaut: 5): ").strip()
         try:
             max_k_display = int(max_k_display) if max_k_display else 5
         except ValueError:
@@ -418,13 +1002,13 @@ class GraphConnectivityInterface:
         print("   1. JSON (données structurées)")
         print("   2. TXT (résumé lisible)")
         
-        format_choice = input("\n🎯 Format d'export (1 ou 2): ").strip()
+        format_choice = _prompt("\n🎯 Format d'export (1 ou 2): ").strip()
         format_type = 'json' if format_choice == '1' else 'txt'
         extension = 'json' if format_choice == '1' else 'txt'
         
         # Chemin de sauvegarde
         default_filename = f"connectivity_analysis.{extension}"
-        filepath = input(f"\n📁 Nom du fichier (défaut: {default_filename}): ").strip()
+        filepath = _prompt(f"\n📁 Nom du fichier (défaut: {default_filename}): ").strip()
         
         if not filepath:
             filepath = default_filename
@@ -438,6 +1022,95 @@ class GraphConnectivityInterface:
         except Exception as e:
             print(f"❌ Erreur lors de l'export: {e}")
     
+    def _set_current_graph(self, G: nx.Graph) -> None:
+        """
+        Définit le graphe courant et invalide les caches liés au graphe précédent
+        
+        Args:
+            G: Nouveau graphe courant
+        """
+        self._conn_cache.clear()
+        self.current_graph = G
+        self._graph_fp = None
+        
+        # Caractéristiques affichées par _display_graph_info, constantes pour ce graphe
+        self._graph_stats = {
+            'n': G.number_of_nodes(),
+            'm': G.number_of_edges(),
+            'directed': G.is_directed(),
+            'nodes_preview': list(islice(G.nodes(), 20))
+        }
+    
+    def _graph_fingerprint(self) -> Tuple:
+        """
+        Empreinte exacte du graphe courant, calculée à la première demande
+        
+        Returns:
+            Tuple: Clé compacte (voir graph_connectivity._structure_key)
+        """
+        if self._graph_fp is None:
+            self._graph_fp = _structure_key(self.current_graph)
+        return self._graph_fp
+    
+    def _cache_results(self, key: Tuple, results: ConnectivityResults) -> None:
+        """
+        Mémorise une copie détachée de résultats (sans graphe ni caches
+        d'analyseur), en évinçant les entrées les moins récemment utilisées
+        
+        Args:
+            key: Clé (empreinte du graphe, moteur, max_k)
+            results: Résultats de l'analyse
+        """
+        self._kconn_cache[key] = results._detached()
+        self._kconn_cache.move_to_end(key)
+        while len(self._kconn_cache) > self.results_cache_size:
+            self._kconn_cache.popitem(last=False)
+    
+    def _is_connected(self, G: nx.Graph) -> bool:
+        """
+        Teste la connexité d'un graphe (faible pour un graphe orienté), avec mémorisation
+        
+        Args:
+            G: Graphe à tester
+        
+        Returns:
+            bool: True si le graphe est connexe
+        """
+        key = id(G)
+        connected = self._conn_cache.get(key)
+        if connected is None:
+            connected = self._test_connected(G, self.scipy_connectivity_min_nodes)
+            self._conn_cache[key] = connected
+        return connected
+    
+    @staticmethod
+    def _test_connected(G: nx.Graph, scipy_min_nodes: int) -> bool:
+        """
+        Teste la connexité d'un graphe (faible pour un graphe orienté), sans mémorisation
+        
+        Args:
+            G: Graphe à tester
+            scipy_min_nodes: Nombre de nœuds à partir duquel le parcours passe par SciPy
+        
+        Returns:
+            bool: True si le graphe est connexe
+        """
+        n = G.number_of_nodes()
+        # Invariants en O(1) / O(n) avant le parcours complet
+        if n <= 1:
+            return True
+        if G.number_of_edges() < n - 1:
+            return False
+        if any(d == 0 for _, d in G.degree()):
+            return False
+        if n >= scipy_min_nodes:
+            # Parcours en C sur la matrice d'adjacence creuse
+            adjacency = nx.to_scipy_sparse_array(G, weight=None, format='csr')
+            n_components, _ = connected_components(adjacency, directed=G.is_directed(),
+                                                   connection='weak')
+            return n_components == 1
+        return nx.is_weakly_connected(G) if G.is_directed() else nx.is_connected(G)
+    
     def _display_graph_info(self) -> None:
         """
         Affiche les informations sur le graphe actuel
@@ -446,79 +1119,37 @@ class GraphConnectivityInterface:
             print("❌ Aucun graphe chargé.")
             return
         
-        print("\n📊 INFORMATIONS SUR LE GRAPHE ACTUEL")
-        print("="*40)
-        print(f"   • Nombre de nœuds: {self.current_graph.number_of_nodes()}")
-        print(f"   • Nombre d'arêtes: {self.current_graph.number_of_edges()}")
-        print(f"   • Type: {'Orienté' if self.current_graph.is_directed() else 'Non orienté'}")
-        print(f"   • Connexe: {'Oui' if nx.is_connected(self.current_graph) else 'Non'}")
+        stats = self._graph_stats
+        lines = [
+            "\n📊 INFORMATIONS SUR LE GRAPHE ACTUEL",
+            "="*40,
+            f"   • Nombre de nœuds: {stats['n']}",
+            f"   • Nombre d'arêtes: {stats['m']}",
+            f"   • Type: {'Orienté' if stats['directed'] else 'Non orienté'}",
+            f"   • Connexe: {'Oui' if self._is_connected(self.current_graph) else 'Non'}"
+        ]
         
         # Nœuds (limité à 20 pour éviter l'encombrement)
-        nodes = list(self.current_graph.nodes())
-        if len(nodes) <= 20:
-            print(f"   • Nœuds: {nodes}")
+        nodes = stats['nodes_preview']
+        if stats['n'] <= 20:
+            lines.append(f"   • Nœuds: {nodes}")
         else:
-            print(f"   • Nœuds: {nodes[:10]}... (et {len(nodes)-10} autres)")
+            lines.append(f"   • Nœuds: {nodes[:10]}... (et {stats['n']-10} autres)")
+        
+        # Une seule écriture sur la sortie standard
+        print("\n".join(lines))
     
     def display_help(self) -> None:
         """
         Affiche l'aide détaillée
         """
-        help_text = """
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                                AIDE DÉTAILLÉE                                ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-
-🔍 CONCEPTS DE K-CONNEXITÉ:
-
-📌 Connexité par nœuds κ(G):
-   • Nombre minimum de nœuds à supprimer pour déconnecter le graphe
-   • Un graphe est k-connexe par nœuds si κ(G) ≥ k
-
-📌 Connexité par arêtes λ(G):
-   • Nombre minimum d'arêtes à supprimer pour déconnecter le graphe
-   • Un graphe est k-connexe par arêtes si λ(G) ≥ k
-
-📌 Relation fondamentale:
-   • κ(G) ≤ λ(G) ≤ δ(G) où δ(G) est le degré minimum
-
-🛠️ UTILISATION DU PROGRAMME:
-
-1️⃣ CHARGEMENT DE GRAPHES:
-   • Fichiers EdgeList: une arête par ligne (format: nœud1 nœud2)
-   • Fichiers GML/GraphML: formats standard NetworkX
-   • Création manuelle: saisie interactive des arêtes
-   • Graphes d'exemple: collection de graphes classiques
-
-2️⃣ ANALYSE:
-   • Calcul automatique de κ(G) et λ(G)
-   • Identification des coupes minimales
-   • Test de k-connexité pour différentes valeurs de k
-
-3️⃣ VISUALISATION:
-   • Graphe de base avec différents layouts
-   • Visualisation des coupes minimales (nœuds/arêtes en rouge)
-   • Comparaison visuelle pour différentes valeurs de k
-
-4️⃣ EXPORT:
-   • JSON: données complètes pour traitement ultérieur
-   • TXT: résumé lisible pour rapport
-
-💡 CONSEILS:
-   • Utilisez les graphes d'exemple pour vous familiariser
-   • Pour de gros graphes, limitez la valeur maximale de k
-   • La visualisation est optimale pour des graphes < 50 nœuds
-   • Les calculs peuvent être longs pour des graphes très denses
-
-❓ INTERPRÉTATION DES RÉSULTATS:
-   • κ(G) = 0: graphe non connexe ou trivial
-   • κ(G) = 1: graphe connexe avec points d'articulation
-   • κ(G) ≥ 2: graphe robuste, pas de point de défaillance unique
-   • Plus κ(G) et λ(G) sont élevés, plus le graphe est robuste
-
-═══════════════════════════════════════════════════════════════════════════════
+        _write_bytes(_HELP_BYTES)
+    
+    def _invalid_choice(self) -> None:
         """
-        print(help_text)
+        Signale un choix absent du menu
+        """
+        print("❌ Choix invalide. Veuillez choisir une option valide.")
     
     def run(self) -> None:
         """
@@ -530,56 +1161,27 @@ class GraphConnectivityInterface:
             self.display_menu()
             
             try:
-                choice = input("\n🎯 Votre choix: ").strip()
+                choice = _prompt("\n🎯 Votre choix: ").strip()
+                
+                handler = self._menu_dispatch.get(choice, self._invalid_choice)
                 
-                if choice == '0':
+                if handler is None:
+                    # Une analyse encore en arrière-plan (fil démon) est abandonnée
                     print("\n👋 Au revoir! Merci d'avoir utilisé l'analyseur de k-connexité.")
                     break
-                    
-                elif choice == '1':
-                    self.load_graph_from_file()
-                    
-                elif choice == '2':
-                    self.create_graph_manually()
-                    
-                elif choice == '3':
-                    self.use_example_graph()
-                    
-                elif choice == '4':
-                    self.analyze_connectivity()
-                    
-                elif choice == '5':
-                    self.visualize_graph()
-                    
-                elif choice == '6':
-                    self.visualize_connectivity()
-                    
-                elif choice == '7':
-                    self.visualize_k_comparison()
-                    
-                elif choice == '8':
-                    self.export_results()
-                    
-                elif choice == '9':
-                    self._display_graph_info()
-                    
-                elif choice == '10':
-                    self.display_help()
-                    
-                else:
-                    print("❌ Choix invalide. Veuillez choisir une option valide.")
+                
+                handler()
                 
                 # Pause avant de continuer
-                if choice != '0':
-                    input("\n⏸️ Appuyez sur Entrée pour continuer...")
-                    print("\n" * 2)  # Espacement
+                _prompt("\n⏸️ Appuyez sur Entrée pour continuer...")
+                print("\n" * 2)  # Espacement
                     
             except KeyboardInterrupt:
                 print("\n\n👋 Interruption détectée. Au revoir!")
                 break
             except Exception as e:
                 print(f"\n❌ Erreur inattendue: {e}")
-                input("\n⏸️ Appuyez sur Entrée pour continuer...")
+                _prompt("\n⏸️ Appuyez sur Entrée pour continuer...")
 
 def main():
     """
@@ -587,18 +1189,17 @@ def main():
     """
     try:
         # Vérification des dépendances
-        required_modules = ['networkx', 'matplotlib', 'numpy']
+        required_modules = ['networkx', 'matplotlib', 'numpy', 'scipy']
         missing_modules = []
         
         for module in required_modules:
-            try:
-                __import__(module)
-            except ImportError:
+            # Présence vérifiée sans import (matplotlib n'est chargé qu'à la visualisation)
+            if importlib.util.find_spec(module) is None:
                 missing_modules.append(module)
         
         if missing_modules:
             print(f"❌ Modules manquants: {', '.join(missing_modules)}")
-            print("💡 Installez-les avec: pip install networkx matplotlib numpy")
+            print("💡 Installez-les avec: pip install networkx matplotlib numpy scipy")
             return
         
         # Lancement de l'interface